@@ -8,7 +8,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import Base
-from app.models import User, Article
+from app.models import User, Article, ArticleContent, ParseJob, ParsedPage
 
 config = context.config
 
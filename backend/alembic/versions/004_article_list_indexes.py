@@ -0,0 +1,45 @@
+"""Add composite indexes matching the article list and lookup queries
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_articles_user_saved', 'articles', ['user_id', 'saved_at', 'id'], unique=False)
+    op.create_index(
+        'ix_articles_user_archived_saved', 'articles', ['user_id', 'is_archived', 'saved_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_articles_user_read_saved', 'articles', ['user_id', 'is_read', 'saved_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_articles_user_archived_read_saved', 'articles',
+        ['user_id', 'is_archived', 'is_read', 'saved_at', 'id'], unique=False
+    )
+    op.create_index('ix_articles_user_url', 'articles', ['user_id', 'url'], unique=False)
+
+    # Both are prefixes of indexes above (or of the primary key)
+    op.drop_index('ix_articles_user_id', table_name='articles')
+    op.drop_index('ix_articles_id', table_name='articles')
+
+
+def downgrade() -> None:
+    op.create_index('ix_articles_id', 'articles', ['id'], unique=False)
+    op.create_index('ix_articles_user_id', 'articles', ['user_id'], unique=False)
+
+    op.drop_index('ix_articles_user_url', table_name='articles')
+    op.drop_index('ix_articles_user_archived_read_saved', table_name='articles')
+    op.drop_index('ix_articles_user_read_saved', table_name='articles')
+    op.drop_index('ix_articles_user_archived_saved', table_name='articles')
+    op.drop_index('ix_articles_user_saved', table_name='articles')
@@ -0,0 +1,174 @@
+"""Move article bodies into a compressed article_contents table
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.search import SQLITE_SEARCH_DDL, POSTGRES_SEARCH_DDL
+from app.services.compression import compress_text, decompress_text
+
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+# Rows rewritten per round trip, so large libraries never sit in memory at once
+CHUNK_SIZE = 500
+
+article_contents = sa.table(
+    'article_contents',
+    sa.column('article_id', sa.Integer),
+    sa.column('codec', sa.String),
+    sa.column('size', sa.Integer),
+    sa.column('data', sa.LargeBinary),
+)
+
+
+def _drop_sqlite_search() -> None:
+    for trigger in (
+        'articles_fts_insert', 'articles_fts_delete', 'articles_fts_update',
+        'article_contents_fts_insert', 'article_contents_fts_delete', 'article_contents_fts_update',
+    ):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS articles_fts")
+    op.execute("DROP VIEW IF EXISTS article_texts")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+
+    op.create_table(
+        'article_contents',
+        sa.Column('article_id', sa.Integer(), nullable=False),
+        sa.Column('codec', sa.String(length=16), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(['article_id'], ['articles.id'], ),
+        sa.PrimaryKeyConstraint('article_id'),
+    )
+
+    if dialect == 'sqlite':
+        _drop_sqlite_search()
+    elif dialect == 'postgresql':
+        # Built from the plain-text column while it still exists
+        op.execute("ALTER TABLE articles ADD COLUMN search_vector tsvector")
+        op.execute(
+            "UPDATE articles SET search_vector = "
+            "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))"
+        )
+        op.execute("DROP INDEX IF EXISTS ix_articles_search")
+
+    raw_bytes = stored_bytes = rows_moved = 0
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, content FROM articles WHERE id > :last_id AND content IS NOT NULL "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": CHUNK_SIZE},
+        ).all()
+        if not rows:
+            break
+
+        values = []
+        for article_id, content in rows:
+            codec, data = compress_text(content)
+            values.append({"article_id": article_id, "codec": codec, "size": len(content.encode()), "data": data})
+            raw_bytes += values[-1]["size"]
+            stored_bytes += len(data)
+        bind.execute(article_contents.insert(), values)
+        rows_moved += len(rows)
+        last_id = rows[-1][0]
+
+    with op.batch_alter_table('articles') as batch_op:
+        batch_op.drop_column('content')
+
+    if dialect == 'sqlite':
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+        op.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        for statement in POSTGRES_SEARCH_DDL:
+            op.execute(statement)
+
+    if raw_bytes:
+        logger.info(
+            "Compressed %d article bodies: %.1f MB -> %.1f MB (%.0f%% smaller)%s",
+            rows_moved, raw_bytes / 1e6, stored_bytes / 1e6, 100 * (1 - stored_bytes / raw_bytes),
+            "; run VACUUM to return the space to the filesystem" if dialect == 'sqlite' else "",
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+
+    if dialect == 'sqlite':
+        _drop_sqlite_search()
+    elif dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_articles_search")
+        op.execute("ALTER TABLE articles DROP COLUMN IF EXISTS search_vector")
+
+    op.add_column('articles', sa.Column('content', sa.Text(), nullable=True))
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT article_id, codec, data FROM article_contents WHERE article_id > :last_id "
+                "ORDER BY article_id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": CHUNK_SIZE},
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text("UPDATE articles SET content = :content WHERE id = :id"),
+            [{"id": article_id, "content": decompress_text(codec, data)} for article_id, codec, data in rows],
+        )
+        last_id = rows[-1][0]
+
+    op.drop_table('article_contents')
+
+    # Restore the search index from 003
+    if dialect == 'sqlite':
+        op.execute("""
+            CREATE VIRTUAL TABLE articles_fts USING fts5(
+                title, content, content='articles', content_rowid='id', tokenize='porter unicode61'
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER articles_fts_insert AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER articles_fts_delete AFTER DELETE ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, content)
+                VALUES ('delete', old.id, old.title, old.content);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER articles_fts_update AFTER UPDATE OF title, content ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, content)
+                VALUES ('delete', old.id, old.title, old.content);
+                INSERT INTO articles_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+            END
+        """)
+        op.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+    elif dialect == 'postgresql':
+        op.execute(
+            "CREATE INDEX ix_articles_search ON articles USING gin "
+            "((to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))))"
+        )
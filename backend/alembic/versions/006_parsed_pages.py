@@ -0,0 +1,40 @@
+"""Add parsed_pages, the shared cache of parsed articles
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'parsed_pages',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('url_hash', sa.String(length=64), nullable=False),
+        sa.Column('url', sa.String(length=2048), nullable=False),
+        sa.Column('etag', sa.String(length=255), nullable=True),
+        sa.Column('last_modified', sa.String(length=64), nullable=True),
+        sa.Column('codec', sa.String(length=16), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.Column('hits', sa.Integer(), nullable=False),
+        sa.Column('fetched_at', sa.DateTime(), nullable=False),
+        sa.Column('last_used_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('url_hash'),
+    )
+    op.create_index('ix_parsed_pages_last_used_at', 'parsed_pages', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_parsed_pages_last_used_at', table_name='parsed_pages')
+    op.drop_table('parsed_pages')
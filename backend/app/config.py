@@ -6,10 +6,59 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env")
 
     database_url: str = "sqlite:///./data/pocket.db"
+
+    # SQLite tuning applied to every new connection; ignored for other databases
+    sqlite_journal_mode: str = "wal"
+    sqlite_synchronous: str = "normal"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 65536
+    sqlite_mmap_size_bytes: int = 268435456
+
+    # Route small writes (read/archive flags) through a single writer that
+    # commits whatever has queued up together; SQLite only
+    write_queue_enabled: bool = False
+    write_queue_max_batch: int = 256
+    write_queue_max_delay_ms: float = 0.0  # linger for more writes before committing
+
     secret_key: str = "your-secret-key-change-in-production"
     access_token_expire_minutes: int = 1440  # 24 hours
+    bcrypt_rounds: int = 12
+
+    # Password hashing runs on its own threads so a login burst can't starve
+    # other requests; beyond workers + queue size, signup/login return 503
+    password_hash_workers: int = 2
+    password_hash_queue_size: int = 16
     cors_origins: str = "http://localhost:5173,http://localhost:3000"
 
+    # Verified access tokens are cached per process for this long
+    auth_cache_ttl_seconds: float = 60.0
+    auth_cache_max_entries: int = 10000
+
+    # Background ingestion worker (python -m app.worker)
+    worker_concurrency: int = 8
+    worker_poll_interval_seconds: float = 1.0
+    parse_job_lease_seconds: int = 120
+    parse_job_max_attempts: int = 3
+    parse_job_retry_backoff_seconds: int = 30
+
+    # Outbound HTTP client used to fetch articles
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_max_connections_per_host: int = 6
+    http_keepalive_expiry_seconds: float = 30.0
+    http_connect_timeout_seconds: float = 5.0
+    http_read_timeout_seconds: float = 20.0
+    http_http2: bool = True  # only used when the h2 package is installed
+
+    # Process pool for CPU-bound HTML extraction; 0 means one process per core
+    extraction_pool_size: int = 0
+    extraction_cpu_budget_seconds: float = 10.0  # per document, 0 disables
+
+    # Parsed pages shared across users, keyed by canonical URL. Entries older
+    # than the TTL are revalidated with a conditional GET before reuse.
+    parse_cache_ttl_seconds: int = 86400
+    parse_cache_max_entries: int = 10000
+
     @property
     def cors_origins_list(self) -> list[str]:
         return [origin.strip() for origin in self.cors_origins.split(",")]
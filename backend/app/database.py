@@ -1,12 +1,55 @@
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import get_settings
 
 settings = get_settings()
 
+# Async drivers for the API, by backend; the worker and migrations stay sync
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def async_database_url(url: str) -> str:
+    """The same database as `url`, addressed through its asyncio driver."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        return url
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+def sqlite_pragmas() -> list[str]:
+    """The tuning profile from settings, as statements to run on each connection."""
+    return [
+        # First, so the journal mode switch below can wait out other connections
+        f"PRAGMA busy_timeout = {settings.sqlite_busy_timeout_ms}",
+        f"PRAGMA journal_mode = {settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous = {settings.sqlite_synchronous}",
+        f"PRAGMA cache_size = -{settings.sqlite_cache_size_kib}",
+        f"PRAGMA mmap_size = {settings.sqlite_mmap_size_bytes}",
+    ]
+
+
+def apply_sqlite_profile(engine: Engine) -> None:
+    """Run `sqlite_pragmas()` on every new connection of a SQLite engine.
+    For an async engine, pass its `sync_engine`."""
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in sqlite_pragmas():
+            cursor.execute(pragma)
+        cursor.close()
+
+
+url = make_url(settings.database_url)
+is_sqlite = url.get_backend_name() == "sqlite"
+
 # SQLite specific: check_same_thread=False for FastAPI
-connect_args = {"check_same_thread": False} if "sqlite" in settings.database_url else {}
+connect_args = {"check_same_thread": False} if is_sqlite else {}
 
 engine = create_engine(
     settings.database_url,
@@ -16,14 +59,26 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine_args = {}
+if is_sqlite and url.database not in (None, "", ":memory:"):
+    # aiosqlite runs a thread per connection; reuse them instead of
+    # opening one per request
+    async_engine_args["poolclass"] = AsyncAdaptedQueuePool
+
+async_engine = create_async_engine(async_database_url(settings.database_url), echo=False, **async_engine_args)
+
+# Objects stay usable after commit; async sessions can't lazily reload them
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+if is_sqlite:
+    apply_sqlite_profile(engine)
+    apply_sqlite_profile(async_engine.sync_engine)
+
 
 class Base(DeclarativeBase):
     pass
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
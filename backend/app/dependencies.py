@@ -1,19 +1,25 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import User
-from app.services.auth import decode_access_token
+from app.services.auth import decode_access_token, access_token_expiry
+from app.services.token_cache import Principal, token_cache
 
 security = HTTPBearer()
 
 
-def get_current_user(
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
     token = credentials.credentials
+    principal = token_cache.get(token)
+    if principal is not None:
+        return principal
+
     user_id = decode_access_token(token)
 
     if user_id is None:
@@ -23,7 +29,25 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
+    row = (await db.execute(select(User.id, User.email).where(User.id == user_id))).first()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    principal = Principal(user_id=row.id, email=row.email)
+    token_cache.put(token, principal, access_token_expiry(token))
+    return principal
+
+
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """The full `User` row, for the few routes that need more than the principal."""
+    user = await db.get(User, principal.user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -5,8 +5,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.database import engine, Base
+from app.database import engine, async_engine, is_sqlite, Base
 from app.routes import auth, articles
+from app.services.http_client import start_http_client, close_http_client
+from app.services.extraction import shutdown_extraction_pool
+from app.services.auth import shutdown_password_hasher
+from app.services.write_queue import start_write_queue, stop_write_queue
 
 settings = get_settings()
 
@@ -17,7 +21,16 @@ async def lifespan(app: FastAPI):
     os.makedirs("data", exist_ok=True)
     # Create database tables
     Base.metadata.create_all(bind=engine)
+    # Shared keep-alive client for fetching articles
+    start_http_client()
+    if settings.write_queue_enabled and is_sqlite:
+        start_write_queue(async_engine)
     yield
+    await stop_write_queue()
+    await close_http_client()
+    shutdown_extraction_pool()
+    shutdown_password_hasher()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -1,4 +1,8 @@
 from app.models.user import User
 from app.models.article import Article
+from app.models.article_content import ArticleContent
+from app.models.parse_job import ParseJob, ParseJobStatus
+from app.models.parsed_page import ParsedPage
+from app.models import search  # noqa: F401  (registers the full-text index DDL)
 
-__all__ = ["User", "Article"]
+__all__ = ["User", "Article", "ArticleContent", "ParseJob", "ParseJobStatus", "ParsedPage"]
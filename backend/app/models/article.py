@@ -1,19 +1,28 @@
 from datetime import datetime
-from sqlalchemy import String, Text, Integer, Boolean, DateTime, ForeignKey
+from sqlalchemy import String, Integer, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.models.article_content import ArticleContent
 
 
 class Article(Base):
     __tablename__ = "articles"
+    # Listing filters on the read/archived flags and pages by (saved_at, id);
+    # each combination gets an index that returns rows already in order.
+    __table_args__ = (
+        Index("ix_articles_user_saved", "user_id", "saved_at", "id"),
+        Index("ix_articles_user_archived_saved", "user_id", "is_archived", "saved_at", "id"),
+        Index("ix_articles_user_read_saved", "user_id", "is_read", "saved_at", "id"),
+        Index("ix_articles_user_archived_read_saved", "user_id", "is_archived", "is_read", "saved_at", "id"),
+        Index("ix_articles_user_url", "user_id", "url"),
+    )
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     url: Mapped[str] = mapped_column(String(2048))
     title: Mapped[str] = mapped_column(String(500))
     author: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    content: Mapped[str | None] = mapped_column(Text, nullable=True)
     excerpt: Mapped[str | None] = mapped_column(String(500), nullable=True)
     thumbnail_url: Mapped[str | None] = mapped_column(String(2048), nullable=True)
     site_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -25,3 +34,24 @@ class Article(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     user: Mapped["User"] = relationship(back_populates="articles")
+    job: Mapped["ParseJob | None"] = relationship(
+        back_populates="article", cascade="all, delete-orphan", lazy="selectin"
+    )
+    # Loaded only when `content` is read
+    body: Mapped["ArticleContent | None"] = relationship(
+        back_populates="article", cascade="all, delete-orphan"
+    )
+
+    @property
+    def content(self) -> str | None:
+        return self.body.text if self.body is not None else None
+
+    @content.setter
+    def content(self, value: str | None) -> None:
+        if value is None:
+            self.body = None
+        elif self.body is None:
+            self.body = ArticleContent()
+            self.body.text = value
+        else:
+            self.body.text = value
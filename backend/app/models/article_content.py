@@ -0,0 +1,27 @@
+from sqlalchemy import String, Integer, LargeBinary, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.database import Base
+from app.services.compression import compress_text, decompress_text
+
+
+class ArticleContent(Base):
+    """An article body, compressed and kept out of the `articles` rows."""
+    __tablename__ = "article_contents"
+
+    article_id: Mapped[int] = mapped_column(ForeignKey("articles.id"), primary_key=True)
+    codec: Mapped[str] = mapped_column(String(16))
+    # Uncompressed length in bytes
+    size: Mapped[int] = mapped_column(Integer)
+    data: Mapped[bytes] = mapped_column(LargeBinary)
+
+    article: Mapped["Article"] = relationship(back_populates="body")
+
+    @property
+    def text(self) -> str:
+        return decompress_text(self.codec, self.data)
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.codec, self.data = compress_text(value)
+        self.size = len(value.encode())
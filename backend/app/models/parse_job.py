@@ -0,0 +1,33 @@
+import enum
+from datetime import datetime
+from sqlalchemy import String, Text, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.database import Base
+
+
+class ParseJobStatus(str, enum.Enum):
+    PENDING = "pending"
+    PARSING = "parsing"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ParseJob(Base):
+    __tablename__ = "parse_jobs"
+    __table_args__ = (
+        Index("ix_parse_jobs_status_run_after", "status", "run_after"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    article_id: Mapped[int] = mapped_column(ForeignKey("articles.id"), unique=True)
+    status: Mapped[str] = mapped_column(String(16), default=ParseJobStatus.PENDING.value)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    run_after: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    lease_token: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    leased_until: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    article: Mapped["Article"] = relationship(back_populates="job")
@@ -0,0 +1,26 @@
+from datetime import datetime
+from sqlalchemy import String, Integer, LargeBinary, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class ParsedPage(Base):
+    """A parsed page shared by every user who saves its URL."""
+    __tablename__ = "parsed_pages"
+    __table_args__ = (
+        Index("ix_parsed_pages_last_used_at", "last_used_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    # sha256 of the canonical URL; keeps the unique index small
+    url_hash: Mapped[str] = mapped_column(String(64), unique=True)
+    url: Mapped[str] = mapped_column(String(2048))
+    etag: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # The ParsedArticle as compressed JSON
+    codec: Mapped[str] = mapped_column(String(16))
+    data: Mapped[bytes] = mapped_column(LargeBinary)
+    hits: Mapped[int] = mapped_column(Integer, default=0)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    last_used_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,144 @@
+"""
+Full-text search index over article titles and content.
+
+Bodies are stored compressed in `article_contents`, so neither database can
+index them directly.
+
+SQLite uses an FTS5 external-content table over the `article_texts` view,
+which decompresses bodies through the `article_text()` SQL function that is
+registered on every connection, sync or async. Triggers on both tables keep
+the index in step: each one removes the document as it was indexed and adds
+it back as it is now.
+
+Postgres keeps a `search_vector` tsvector column on `articles`, filled in
+after each flush that changes a title or body, with a GIN index over it.
+"""
+import sqlite3
+
+from sqlalchemy import DDL, Engine, event, inspect, text
+from sqlalchemy.dialects.sqlite.aiosqlite import AsyncAdapt_aiosqlite_connection
+from sqlalchemy.orm import Session
+
+from app.models.article import Article
+from app.models.article_content import ArticleContent
+from app.services.compression import decompress_text
+
+
+def _article_text(codec: str | None, data: bytes | None) -> str | None:
+    return None if data is None else decompress_text(codec, data)
+
+
+@event.listens_for(Engine, "connect")
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, (sqlite3.Connection, AsyncAdapt_aiosqlite_connection)):
+        dbapi_connection.create_function("article_text", 2, _article_text, deterministic=True)
+
+
+_CURRENT_CONTENT = "(SELECT article_text(codec, data) FROM article_contents WHERE article_id = {id})"
+
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIEW IF NOT EXISTS article_texts AS
+    SELECT articles.id, articles.title, article_text(article_contents.codec, article_contents.data) AS content
+    FROM articles LEFT JOIN article_contents ON article_contents.article_id = articles.id
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+        title, content, content='article_texts', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, title, content)
+        VALUES (new.id, new.title, {_CURRENT_CONTENT.format(id="new.id")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, {_CURRENT_CONTENT.format(id="old.id")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, {_CURRENT_CONTENT.format(id="old.id")});
+        INSERT INTO articles_fts(rowid, title, content)
+        VALUES (new.id, new.title, {_CURRENT_CONTENT.format(id="new.id")});
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS article_contents_fts_insert AFTER INSERT ON article_contents BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content)
+        SELECT 'delete', id, title, NULL FROM articles WHERE id = new.article_id;
+        INSERT INTO articles_fts(rowid, title, content)
+        SELECT id, title, article_text(new.codec, new.data) FROM articles WHERE id = new.article_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS article_contents_fts_delete AFTER DELETE ON article_contents BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content)
+        SELECT 'delete', id, title, article_text(old.codec, old.data) FROM articles WHERE id = old.article_id;
+        INSERT INTO articles_fts(rowid, title, content)
+        SELECT id, title, NULL FROM articles WHERE id = old.article_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS article_contents_fts_update AFTER UPDATE OF codec, data ON article_contents BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content)
+        SELECT 'delete', id, title, article_text(old.codec, old.data) FROM articles WHERE id = old.article_id;
+        INSERT INTO articles_fts(rowid, title, content)
+        SELECT id, title, article_text(new.codec, new.data) FROM articles WHERE id = new.article_id;
+    END
+    """,
+]
+
+POSTGRES_SEARCH_DDL = [
+    "ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    "CREATE INDEX IF NOT EXISTS ix_articles_search ON articles USING gin (search_vector)",
+]
+
+# The content table and view must exist before the triggers that use them
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(ArticleContent.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(Article.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+for statement in ("DROP TABLE IF EXISTS articles_fts", "DROP VIEW IF EXISTS article_texts"):
+    event.listen(
+        ArticleContent.__table__,
+        "before_drop",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _update_postgres_search_vectors(session, flush_context):
+    if session.get_bind().dialect.name != "postgresql":
+        return
+
+    changed = {}
+    for obj in session.new | session.dirty:
+        if isinstance(obj, ArticleContent):
+            article = obj.article
+        elif isinstance(obj, Article):
+            state = inspect(obj)
+            if not (obj in session.new
+                    or state.attrs.title.history.has_changes()
+                    or state.attrs.body.history.has_changes()):
+                continue
+            article = obj
+        else:
+            continue
+        if article is not None:
+            changed[article.id] = article
+
+    if changed:
+        session.connection().execute(
+            text("""
+                UPDATE articles
+                SET search_vector = to_tsvector('english', coalesce(:title, '') || ' ' || coalesce(:content, ''))
+                WHERE id = :id
+            """),
+            [{"id": obj.id, "title": obj.title, "content": obj.content} for obj in changed.values()],
+        )
@@ -1,27 +1,56 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+from sqlalchemy import select, func, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, noload, selectinload
 
 from app.database import get_db
-from app.models.user import User
 from app.models.article import Article
-from app.schemas.article import ArticleCreate, ArticleUpdate, ArticleResponse, ArticleListResponse
-from app.services.parser import parse_article
-from app.dependencies import get_current_user
+from app.schemas.article import (
+    ArticleCreate,
+    ArticleBatchCreate,
+    ArticleUpdate,
+    ParseJobResponse,
+    ArticleSummary,
+    ArticleResponse,
+    ArticleListResponse,
+    ArticleSearchResult,
+    ArticleSearchResponse,
+    ArticleBatchResult,
+    ArticleBatchResponse,
+)
+from app.services.ingest import new_pending_article, queue_articles
+from app.services.pagination import InvalidCursor, encode_cursor, decode_cursor
+from app.services.search import SearchPage, full_text_search
+from app.services.write_queue import get_write_queue
+from app.dependencies import Principal, get_current_principal
 
 router = APIRouter()
 
+# URLs inserted per bulk INSERT/commit in the batch endpoint
+BATCH_CHUNK_SIZE = 100
+
+SUMMARY_FIELDS = tuple(ArticleSummary.model_fields)
+SEARCH_FIELDS = SUMMARY_FIELDS + ("snippet", "score")
 
-@router.post("", response_model=ArticleResponse, status_code=status.HTTP_201_CREATED)
+
+@router.post("", response_model=ArticleResponse, status_code=status.HTTP_202_ACCEPTED)
 async def create_article(
     article_data: ArticleCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
 ):
     # Check if article already exists for this user
-    existing = db.query(Article).filter(
-        Article.user_id == current_user.id,
-        Article.url == str(article_data.url),
-    ).first()
+    existing = await db.scalar(
+        select(Article.id).where(
+            Article.user_id == principal.user_id,
+            Article.url == str(article_data.url),
+        )
+    )
 
     if existing:
         raise HTTPException(
@@ -29,134 +58,272 @@ async def create_article(
             detail="Article already saved",
         )
 
-    # Parse article content
-    parsed = await parse_article(str(article_data.url))
-
-    # Create article
-    article = Article(
-        user_id=current_user.id,
-        url=str(article_data.url),
-        title=parsed.title,
-        author=parsed.author,
-        content=parsed.content,
-        excerpt=parsed.excerpt,
-        thumbnail_url=parsed.thumbnail_url,
-        site_name=parsed.site_name,
-        word_count=parsed.word_count,
-        reading_time_minutes=parsed.reading_time_minutes,
-    )
+    # Save a placeholder right away; the worker fetches and parses the content
+    article = new_pending_article(principal.user_id, str(article_data.url))
     db.add(article)
-    db.commit()
-    db.refresh(article)
+    await db.commit()
 
     return article
 
 
+@router.post("/batch", response_model=ArticleBatchResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_articles_batch(
+    batch: ArticleBatchCreate,
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
+):
+    results: list[ArticleBatchResult] = []
+    new_urls: dict[str, ArticleBatchResult] = {}
+
+    for raw_url in batch.urls:
+        result = ArticleBatchResult(url=raw_url, status="queued")
+        results.append(result)
+        try:
+            url = str(ArticleCreate(url=raw_url).url)
+        except ValidationError:
+            result.status, result.detail = "invalid", "Invalid URL"
+            continue
+        if url in new_urls:
+            result.status, result.detail = "duplicate", "Repeated in batch"
+            continue
+        new_urls[url] = result
+
+    # One IN query finds everything this user has already saved
+    existing = await db.execute(
+        select(Article.id, Article.url).where(
+            Article.user_id == principal.user_id,
+            Article.url.in_(new_urls),
+        )
+    )
+    for article_id, url in existing:
+        result = new_urls.pop(url)
+        result.status, result.article_id, result.detail = "duplicate", article_id, "Article already saved"
+
+    # Bulk insert placeholders; the worker fetches them with bounded concurrency
+    urls = list(new_urls)
+    for start in range(0, len(urls), BATCH_CHUNK_SIZE):
+        article_ids = await db.run_sync(queue_articles, principal.user_id, urls[start:start + BATCH_CHUNK_SIZE])
+        await db.commit()
+        for url, article_id in article_ids.items():
+            new_urls[url].article_id = article_id
+
+    return ArticleBatchResponse(results=results, queued=len(urls))
+
+
+def _decode_cursor(cursor: str, kind: str) -> list:
+    try:
+        return decode_cursor(cursor, kind)
+    except InvalidCursor as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+def _check_paging(cursor: str | None, offset: int) -> None:
+    if cursor is not None and offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either cursor or offset, not both",
+        )
+
+
+def _parse_fields(fields: str | None, allowed: tuple[str, ...]) -> list[str] | None:
+    if fields is None:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in allowed]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested",
+        )
+    return names
+
+
+def _summary_options(fields: list[str] | None) -> list:
+    """Loader options for a summary, or for just the summary `fields` asked for."""
+    if fields is None:
+        # The body lives in article_contents and is only loaded when read
+        return []
+    # id and saved_at are always needed to build the next cursor
+    columns = [name for name in dict.fromkeys(["id", "saved_at", *fields]) if name in Article.__table__.c]
+    options = [load_only(*(getattr(Article, name) for name in columns))]
+    if "job" not in fields:
+        options.append(noload(Article.job))
+    return options
+
+
+def _sparse(article: Article, fields: list[str], **extra) -> dict:
+    item = {}
+    for name in fields:
+        value = extra[name] if name in extra else getattr(article, name)
+        if name == "job" and value is not None:
+            value = ParseJobResponse.model_validate(value)
+        item[name] = value
+    return item
+
+
 @router.get("", response_model=ArticleListResponse)
-def list_articles(
+async def list_articles(
     is_read: bool | None = Query(None),
     is_archived: bool | None = Query(None),
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    offset: int = Query(0, ge=0, description="Deprecated: use cursor"),
+    include_total: bool = Query(False),
+    fields: str | None = Query(None, description="Comma-separated summary fields to return"),
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
 ):
-    query = db.query(Article).filter(Article.user_id == current_user.id)
+    _check_paging(cursor, offset)
+    selected = _parse_fields(fields, SUMMARY_FIELDS)
+    query = select(Article).where(Article.user_id == principal.user_id)
 
     if is_read is not None:
-        query = query.filter(Article.is_read == is_read)
+        query = query.where(Article.is_read == is_read)
     if is_archived is not None:
-        query = query.filter(Article.is_archived == is_archived)
+        query = query.where(Article.is_archived == is_archived)
 
-    total = query.count()
-    articles = query.order_by(Article.saved_at.desc()).offset(offset).limit(limit).all()
+    total = None
+    if include_total:
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
 
-    return ArticleListResponse(articles=articles, total=total)
+    if cursor is not None:
+        saved_at, article_id = _decode_cursor(cursor, "list")
+        query = query.where(
+            tuple_(Article.saved_at, Article.id) < tuple_(datetime.fromisoformat(saved_at), article_id)
+        )
+
+    # Fetch one extra row to learn whether there is a next page
+    articles = (await db.scalars(
+        query.options(*_summary_options(selected))
+        .order_by(Article.saved_at.desc(), Article.id.desc())
+        .offset(offset)
+        .limit(limit + 1)
+    )).all()
+
+    next_cursor = None
+    if len(articles) > limit:
+        articles = articles[:limit]
+        last = articles[-1]
+        next_cursor = encode_cursor("list", last.saved_at.isoformat(), last.id)
+
+    if selected is not None:
+        return JSONResponse(jsonable_encoder({
+            "articles": [_sparse(article, selected) for article in articles],
+            "total": total,
+            "next_cursor": next_cursor,
+        }))
+    return ArticleListResponse(articles=articles, total=total, next_cursor=next_cursor)
 
 
-@router.get("/search", response_model=ArticleListResponse)
-def search_articles(
+@router.get("/search", response_model=ArticleSearchResponse)
+async def search_articles(
     q: str = Query(..., min_length=1),
     limit: int = Query(50, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    offset: int = Query(0, ge=0, description="Deprecated: use cursor"),
+    include_total: bool = Query(False),
+    fields: str | None = Query(None, description="Comma-separated summary fields to return"),
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
 ):
-    query = db.query(Article).filter(
-        Article.user_id == current_user.id,
-        Article.title.ilike(f"%{q}%"),
-    )
+    _check_paging(cursor, offset)
+    selected = _parse_fields(fields, SEARCH_FIELDS)
+    page = SearchPage(limit=limit + 1, offset=offset, include_total=include_total)
+    if cursor is not None:
+        score, article_id = _decode_cursor(cursor, "search")
+        page.after = (score, article_id)
 
-    total = query.count()
-    articles = query.order_by(Article.saved_at.desc()).offset(offset).limit(limit).all()
+    hits, total = await full_text_search(db, principal.user_id, q, page, options=_summary_options(selected))
 
-    return ArticleListResponse(articles=articles, total=total)
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        next_cursor = encode_cursor("search", hits[-1].score, hits[-1].article.id)
 
+    if selected is not None:
+        return JSONResponse(jsonable_encoder({
+            "articles": [
+                _sparse(hit.article, selected, snippet=hit.snippet, score=hit.score) for hit in hits
+            ],
+            "total": total,
+            "next_cursor": next_cursor,
+        }))
 
-@router.get("/{article_id}", response_model=ArticleResponse)
-def get_article(
-    article_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    article = db.query(Article).filter(
-        Article.id == article_id,
-        Article.user_id == current_user.id,
-    ).first()
+    results = [
+        ArticleSearchResult(
+            **ArticleSummary.model_validate(hit.article).model_dump(),
+            snippet=hit.snippet,
+            score=hit.score,
+        )
+        for hit in hits
+    ]
+    return ArticleSearchResponse(articles=results, total=total, next_cursor=next_cursor)
+
+
+async def _get_owned_article(db: AsyncSession, article_id: int, user_id: int) -> Article:
+    # The body is loaded up front: async sessions can't lazy-load it on access
+    article = await db.scalar(
+        select(Article)
+        .options(selectinload(Article.body))
+        .where(Article.id == article_id, Article.user_id == user_id)
+    )
 
     if not article:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found",
         )
+    return article
+
+
+@router.get("/{article_id}", response_model=ArticleResponse)
+async def get_article(
+    article_id: int,
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
+):
+    article = await _get_owned_article(db, article_id, principal.user_id)
 
     return article
 
 
 @router.patch("/{article_id}", response_model=ArticleResponse)
-def update_article(
+async def update_article(
     article_id: int,
     article_data: ArticleUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
 ):
-    article = db.query(Article).filter(
-        Article.id == article_id,
-        Article.user_id == current_user.id,
-    ).first()
+    update_data = article_data.model_dump(exclude_unset=True)
 
-    if not article:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Article not found",
-        )
+    write_queue = get_write_queue()
+    if write_queue is not None:
+        # Only flags change, so one UPDATE does it, committed along with
+        # other requests' writes; an unknown id simply matches no row
+        if update_data:
+            await write_queue.execute(
+                update(Article)
+                .where(Article.id == article_id, Article.user_id == principal.user_id)
+                .values(**update_data)
+            )
+        return await _get_owned_article(db, article_id, principal.user_id)
 
-    update_data = article_data.model_dump(exclude_unset=True)
+    article = await _get_owned_article(db, article_id, principal.user_id)
     for field, value in update_data.items():
         setattr(article, field, value)
 
-    db.commit()
-    db.refresh(article)
+    await db.commit()
 
     return article
 
 
 @router.delete("/{article_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_article(
+async def delete_article(
     article_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(get_current_principal),
 ):
-    article = db.query(Article).filter(
-        Article.id == article_id,
-        Article.user_id == current_user.id,
-    ).first()
-
-    if not article:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Article not found",
-        )
+    article = await _get_owned_article(db, article_id, principal.user_id)
 
-    db.delete(article)
-    db.commit()
+    await db.delete(article)
+    await db.commit()
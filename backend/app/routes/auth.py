@@ -1,33 +1,53 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
-from app.services.auth import hash_password, verify_password, create_access_token
+from app.services.auth import (
+    PasswordHasherBusy,
+    hash_password_async,
+    verify_password_async,
+    create_access_token,
+)
 from app.dependencies import get_current_user
 
 router = APIRouter()
 
 
+def _hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-in attempts in progress, try again shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/signup", response_model=Token, status_code=status.HTTP_201_CREATED)
-def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User.id).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
+    # Don't hold a pooled connection while bcrypt runs
+    await db.close()
+
+    try:
+        password_hash = await hash_password_async(user_data.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
 
     # Create new user
     user = User(
         email=user_data.email,
-        password_hash=hash_password(user_data.password),
+        password_hash=password_hash,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
 
     # Generate token
     access_token = create_access_token(user.id)
@@ -35,10 +55,17 @@ def signup(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == user_data.email).first()
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
+    user = (await db.execute(select(User.id, User.password_hash).where(User.email == user_data.email))).first()
+    # Don't hold a pooled connection while bcrypt runs
+    await db.close()
+
+    try:
+        valid = user is not None and await verify_password_async(user_data.password, user.password_hash)
+    except PasswordHasherBusy:
+        raise _hasher_busy()
 
-    if not user or not verify_password(user_data.password, user.password_hash):
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -49,5 +76,5 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: User = Depends(get_current_user)):
     return current_user
@@ -1,5 +1,17 @@
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
-from app.schemas.article import ArticleCreate, ArticleUpdate, ArticleResponse, ArticleListResponse
+from app.schemas.article import (
+    ArticleCreate,
+    ArticleBatchCreate,
+    ArticleUpdate,
+    ParseJobResponse,
+    ArticleSummary,
+    ArticleResponse,
+    ArticleListResponse,
+    ArticleSearchResult,
+    ArticleSearchResponse,
+    ArticleBatchResult,
+    ArticleBatchResponse,
+)
 
 __all__ = [
     "UserCreate",
@@ -7,7 +19,14 @@ __all__ = [
     "UserResponse",
     "Token",
     "ArticleCreate",
+    "ArticleBatchCreate",
     "ArticleUpdate",
+    "ParseJobResponse",
+    "ArticleSummary",
     "ArticleResponse",
     "ArticleListResponse",
+    "ArticleSearchResult",
+    "ArticleSearchResponse",
+    "ArticleBatchResult",
+    "ArticleBatchResponse",
 ]
@@ -1,24 +1,37 @@
 from datetime import datetime
-from pydantic import BaseModel, HttpUrl, ConfigDict
+from typing import Literal
+from pydantic import BaseModel, HttpUrl, ConfigDict, Field
 
 
 class ArticleCreate(BaseModel):
     url: HttpUrl
 
 
+class ArticleBatchCreate(BaseModel):
+    urls: list[str] = Field(..., min_length=1, max_length=500)
+
+
 class ArticleUpdate(BaseModel):
     is_read: bool | None = None
     is_archived: bool | None = None
 
 
-class ArticleResponse(BaseModel):
+class ParseJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    status: Literal["pending", "parsing", "done", "failed"]
+    attempts: int
+    last_error: str | None
+
+
+class ArticleSummary(BaseModel):
+    """An article without its body, as shown in lists and search results."""
     model_config = ConfigDict(from_attributes=True)
 
     id: int
     url: str
     title: str
     author: str | None
-    content: str | None
     excerpt: str | None
     thumbnail_url: str | None
     site_name: str | None
@@ -28,8 +41,37 @@ class ArticleResponse(BaseModel):
     is_archived: bool
     saved_at: datetime
     updated_at: datetime
+    job: ParseJobResponse | None = None
+
+
+class ArticleResponse(ArticleSummary):
+    content: str | None
 
 
 class ArticleListResponse(BaseModel):
-    articles: list[ArticleResponse]
-    total: int
+    articles: list[ArticleSummary]
+    total: int | None = None
+    next_cursor: str | None = None
+
+
+class ArticleSearchResult(ArticleSummary):
+    snippet: str | None
+    score: float
+
+
+class ArticleSearchResponse(BaseModel):
+    articles: list[ArticleSearchResult]
+    total: int | None = None
+    next_cursor: str | None = None
+
+
+class ArticleBatchResult(BaseModel):
+    url: str
+    status: Literal["queued", "duplicate", "invalid"]
+    article_id: int | None = None
+    detail: str | None = None
+
+
+class ArticleBatchResponse(BaseModel):
+    results: list[ArticleBatchResult]
+    queued: int
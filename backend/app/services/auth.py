@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from passlib.context import CryptContext
 from jose import JWTError, jwt
@@ -6,10 +8,18 @@ from app.config import get_settings
 
 settings = get_settings()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds)
 
 ALGORITHM = "HS256"
 
+_hash_executor: ThreadPoolExecutor | None = None
+# Hashes running or waiting for a thread; only touched from the event loop
+_hashes_pending = 0
+
+
+class PasswordHasherBusy(Exception):
+    """Too many password hashes are already running or queued."""
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -19,12 +29,53 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def shutdown_password_hasher() -> None:
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
+async def _run_hasher(fn, *args):
+    """
+    Run a bcrypt call on the dedicated hashing threads (bcrypt releases the
+    GIL). Raises PasswordHasherBusy rather than queueing without bound.
+    """
+    global _hash_executor, _hashes_pending
+    if _hashes_pending >= settings.password_hash_workers + settings.password_hash_queue_size:
+        raise PasswordHasherBusy()
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_workers, thread_name_prefix="password-hash"
+        )
+
+    _hashes_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, fn, *args)
+    finally:
+        _hashes_pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hasher(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hasher(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(user_id: int) -> str:
     expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     to_encode = {"sub": str(user_id), "exp": expire}
     return jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
 
 
+def access_token_expiry(token: str) -> float | None:
+    """The `exp` claim of a token that has already been verified."""
+    exp = jwt.get_unverified_claims(token).get("exp")
+    return float(exp) if exp is not None else None
+
+
 def decode_access_token(token: str) -> int | None:
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
@@ -0,0 +1,63 @@
+import asyncio
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from app.config import get_settings
+
+settings = get_settings()
+
+_pool: ProcessPoolExecutor | None = None
+
+
+class ExtractionTimeout(Exception):
+    """A document used more than its CPU time budget."""
+
+
+def _on_cpu_budget_exceeded(signum, frame):
+    raise ExtractionTimeout("extraction exceeded its CPU time budget")
+
+
+def call_with_cpu_budget(fn, *args, budget: float | None = None):
+    """
+    Call `fn(*args)`, aborting it once this process has spent `budget` seconds
+    of CPU time on it. Must run on the main thread of the process.
+    """
+    budget = settings.extraction_cpu_budget_seconds if budget is None else budget
+    if budget <= 0 or not hasattr(signal, "setitimer"):
+        return fn(*args)
+
+    previous_handler = signal.signal(signal.SIGPROF, _on_cpu_budget_exceeded)
+    signal.setitimer(signal.ITIMER_PROF, budget)
+    try:
+        return fn(*args)
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous_handler)
+
+
+def start_extraction_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.extraction_pool_size or os.cpu_count())
+    return _pool
+
+
+def shutdown_extraction_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+async def run_in_pool(fn, *args):
+    """Run a CPU-bound, picklable `fn(*args)` in the extraction process pool."""
+    pool = start_extraction_pool()
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, call_with_cpu_budget, fn, *args)
+    except BrokenProcessPool:
+        # A child died (e.g. killed by the OOM killer); start fresh next time
+        shutdown_extraction_pool()
+        raise
@@ -0,0 +1,66 @@
+import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+
+import httpx
+
+from app.config import get_settings
+
+settings = get_settings()
+
+USER_AGENT = "Mozilla/5.0 (compatible; PocketApp/1.0)"
+
+_client: httpx.AsyncClient | None = None
+_host_slots: dict[str, asyncio.Semaphore] = {}
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        http2=settings.http_http2 and http2_available(),
+        headers={"User-Agent": USER_AGENT},
+        timeout=httpx.Timeout(
+            settings.http_read_timeout_seconds,
+            connect=settings.http_connect_timeout_seconds,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+        transport=transport,
+    )
+
+
+def start_http_client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = create_http_client(transport)
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    _host_slots.clear()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The process-wide client; created on first use if the app didn't start one."""
+    return _client or start_http_client()
+
+
+@asynccontextmanager
+async def host_slot(host: str):
+    """Cap concurrent requests to one host at `http_max_connections_per_host`."""
+    slot = _host_slots.get(host)
+    if slot is None:
+        slot = _host_slots[host] = asyncio.Semaphore(settings.http_max_connections_per_host)
+    async with slot:
+        yield
@@ -0,0 +1,166 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import select, insert, update, or_, and_
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.article import Article
+from app.models.parse_job import ParseJob, ParseJobStatus
+from app.services.parser import ParsedArticle, empty_article
+
+settings = get_settings()
+
+
+@dataclass
+class ClaimedJob:
+    job_id: int
+    article_id: int
+    url: str
+    attempts: int
+    lease_token: str
+
+
+def new_pending_article(user_id: int, url: str) -> Article:
+    """Build a placeholder article with a pending parse job attached."""
+    placeholder = empty_article(url)
+    return Article(
+        user_id=user_id,
+        url=url,
+        title=placeholder.title,
+        site_name=placeholder.site_name,
+        word_count=0,
+        reading_time_minutes=0,
+        job=ParseJob(status=ParseJobStatus.PENDING.value),
+        # Nothing is parsed yet; setting it spares a lazy load when returned
+        body=None,
+    )
+
+
+def queue_articles(db: Session, user_id: int, urls: list[str]) -> dict[str, int]:
+    """
+    Bulk-insert placeholder articles and their parse jobs in one statement
+    each. `urls` must be new for the user. Returns the new article id per URL.
+    """
+    if not urls:
+        return {}
+
+    now = datetime.utcnow()
+    rows = []
+    for url in urls:
+        placeholder = empty_article(url)
+        rows.append({
+            "user_id": user_id,
+            "url": url,
+            "title": placeholder.title,
+            "site_name": placeholder.site_name,
+            "word_count": 0,
+            "reading_time_minutes": 0,
+            "saved_at": now,
+            "updated_at": now,
+        })
+
+    inserted = db.execute(insert(Article).returning(Article.id, Article.url), rows).all()
+    article_ids = {url: article_id for article_id, url in inserted}
+    db.execute(
+        insert(ParseJob),
+        [{"article_id": article_id, "run_after": now} for article_id in article_ids.values()],
+    )
+    return article_ids
+
+
+def claim_jobs(db: Session, limit: int) -> list[ClaimedJob]:
+    """
+    Lease up to `limit` runnable jobs to the caller.
+
+    A job is runnable when it is pending and due, or when a previous worker's
+    lease has expired. The claim is a single conditional UPDATE, so concurrent
+    workers never receive the same job.
+    """
+    now = datetime.utcnow()
+    token = uuid4().hex
+    runnable = or_(
+        and_(ParseJob.status == ParseJobStatus.PENDING.value, ParseJob.run_after <= now),
+        and_(ParseJob.status == ParseJobStatus.PARSING.value, ParseJob.leased_until < now),
+    )
+    candidates = (
+        select(ParseJob.id)
+        .where(runnable)
+        .order_by(ParseJob.run_after, ParseJob.id)
+        .limit(limit)
+    )
+
+    db.execute(
+        update(ParseJob)
+        .where(ParseJob.id.in_(candidates), runnable)
+        .values(
+            status=ParseJobStatus.PARSING.value,
+            attempts=ParseJob.attempts + 1,
+            lease_token=token,
+            leased_until=now + timedelta(seconds=settings.parse_job_lease_seconds),
+            updated_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+    rows = db.execute(
+        select(ParseJob.id, ParseJob.article_id, Article.url, ParseJob.attempts)
+        .join(Article, Article.id == ParseJob.article_id)
+        .where(ParseJob.lease_token == token)
+    ).all()
+    return [
+        ClaimedJob(job_id=row[0], article_id=row[1], url=row[2], attempts=row[3], lease_token=token)
+        for row in rows
+    ]
+
+
+def _leased_job(db: Session, claimed: ClaimedJob) -> ParseJob | None:
+    job = db.get(ParseJob, claimed.job_id)
+    if job is None or job.lease_token != claimed.lease_token:
+        # The article was deleted, or our lease expired and another worker took over
+        return None
+    return job
+
+
+def complete_job(db: Session, claimed: ClaimedJob, parsed: ParsedArticle) -> bool:
+    job = _leased_job(db, claimed)
+    if job is None:
+        return False
+
+    article = job.article
+    article.title = parsed.title
+    article.author = parsed.author
+    article.content = parsed.content
+    article.excerpt = parsed.excerpt
+    article.thumbnail_url = parsed.thumbnail_url
+    article.site_name = parsed.site_name
+    article.word_count = parsed.word_count
+    article.reading_time_minutes = parsed.reading_time_minutes
+
+    job.status = ParseJobStatus.DONE.value
+    job.last_error = None
+    job.lease_token = None
+    job.leased_until = None
+    db.commit()
+    return True
+
+
+def fail_job(db: Session, claimed: ClaimedJob, error: str) -> bool:
+    """Record a failed attempt, scheduling a retry with exponential backoff."""
+    job = _leased_job(db, claimed)
+    if job is None:
+        return False
+
+    job.last_error = error[:2000]
+    job.lease_token = None
+    job.leased_until = None
+    if job.attempts >= settings.parse_job_max_attempts:
+        job.status = ParseJobStatus.FAILED.value
+    else:
+        backoff = settings.parse_job_retry_backoff_seconds * 2 ** (job.attempts - 1)
+        job.status = ParseJobStatus.PENDING.value
+        job.run_after = datetime.utcnow() + timedelta(seconds=backoff)
+    db.commit()
+    return True
@@ -0,0 +1,26 @@
+import base64
+import binascii
+import json
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(kind: str, *values) -> str:
+    """Pack keyset values into an opaque, URL-safe token."""
+    payload = json.dumps([kind, *values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str) -> list:
+    """Unpack a token made by `encode_cursor` for the same `kind` of listing."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, binascii.Error):
+        raise InvalidCursor("Malformed cursor")
+
+    if not isinstance(data, list) or not data or data[0] != kind:
+        raise InvalidCursor("Cursor does not belong to this listing")
+    return data[1:]
@@ -0,0 +1,152 @@
+"""
+Parsed pages shared across users.
+
+Popular links are saved by many users. The worker keys each parsed page by
+its canonical URL, so the page is fetched and parsed once and then reused
+for every later save. Entries past the TTL are revalidated with a
+conditional GET, and the least recently used entries are evicted once the
+cache holds more than `parse_cache_max_entries`.
+"""
+import hashlib
+import json
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from sqlalchemy import select, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.parsed_page import ParsedPage
+from app.services.compression import compress_text, decompress_text
+from app.services.parser import ParsedArticle
+
+settings = get_settings()
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid", "_hsenc", "_hsmi"}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+@dataclass
+class ParseCacheStats:
+    hits: int = 0  # served without a request
+    revalidated: int = 0  # served after a 304 Not Modified
+    misses: int = 0  # fetched and parsed
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.revalidated + self.misses
+        return (self.hits + self.revalidated) / lookups if lookups else 0.0
+
+
+# Counters for this process
+stats = ParseCacheStats()
+
+
+@dataclass
+class CachedParse:
+    parsed: ParsedArticle
+    fresh: bool
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize a URL so trivially different spellings of the same page share
+    a cache entry: lowercase scheme and host, no default port, fragment or
+    tracking parameters, and the remaining query parameters sorted.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port is not None and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def _url_hash(url: str) -> str:
+    return hashlib.sha256(canonical_url(url).encode()).hexdigest()
+
+
+def _encode(parsed: ParsedArticle) -> tuple[str, bytes]:
+    fields = asdict(parsed)
+    del fields["etag"], fields["last_modified"]
+    return compress_text(json.dumps(fields))
+
+
+def lookup(db: Session, url: str) -> CachedParse | None:
+    page = db.scalar(select(ParsedPage).where(ParsedPage.url_hash == _url_hash(url)))
+    if page is None:
+        return None
+
+    parsed = ParsedArticle(
+        **json.loads(decompress_text(page.codec, page.data)),
+        etag=page.etag,
+        last_modified=page.last_modified,
+    )
+    fresh = page.fetched_at > datetime.utcnow() - timedelta(seconds=settings.parse_cache_ttl_seconds)
+    if fresh:
+        stats.hits += 1
+        page.hits += 1
+        page.last_used_at = datetime.utcnow()
+        db.commit()
+    return CachedParse(parsed=parsed, fresh=fresh)
+
+
+def mark_revalidated(db: Session, url: str) -> None:
+    """Record that the origin confirmed the cached copy is still current."""
+    page = db.scalar(select(ParsedPage).where(ParsedPage.url_hash == _url_hash(url)))
+    stats.revalidated += 1
+    if page is not None:
+        page.hits += 1
+        page.fetched_at = page.last_used_at = datetime.utcnow()
+        db.commit()
+
+
+def store(db: Session, url: str, parsed: ParsedArticle) -> None:
+    """Cache a freshly fetched page, replacing any older copy."""
+    stats.misses += 1
+    now = datetime.utcnow()
+    url_hash = _url_hash(url)
+    codec, data = _encode(parsed)
+
+    page = db.scalar(select(ParsedPage).where(ParsedPage.url_hash == url_hash))
+    if page is None:
+        page = ParsedPage(url_hash=url_hash, url=canonical_url(url))
+        db.add(page)
+    page.etag = parsed.etag
+    page.last_modified = parsed.last_modified
+    page.codec, page.data = codec, data
+    page.fetched_at = page.last_used_at = now
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another worker cached the same page first
+        db.rollback()
+        return
+    evict(db)
+
+
+def evict(db: Session, max_entries: int | None = None) -> int:
+    """Drop the least recently used entries beyond `max_entries`."""
+    max_entries = settings.parse_cache_max_entries if max_entries is None else max_entries
+    stale = (
+        select(ParsedPage.id)
+        .order_by(ParsedPage.last_used_at.desc(), ParsedPage.id.desc())
+        .offset(max_entries)
+    )
+    result = db.execute(
+        delete(ParsedPage)
+        .where(ParsedPage.id.in_(stale))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    stats.evictions += result.rowcount
+    return result.rowcount
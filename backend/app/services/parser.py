@@ -1,8 +1,11 @@
-import httpx
-import trafilatura
+from trafilatura import bare_extraction, extract_metadata
+from trafilatura.utils import load_html, normalize_unicode
 from urllib.parse import urlparse
 from dataclasses import dataclass
 
+from app.services.extraction import run_in_pool
+from app.services.http_client import get_http_client, host_slot
+
 
 @dataclass
 class ParsedArticle:
@@ -14,6 +17,9 @@ class ParsedArticle:
     site_name: str | None
     word_count: int
     reading_time_minutes: int
+    # Validators from the response the article was parsed from
+    etag: str | None = None
+    last_modified: str | None = None
 
 
 def calculate_reading_time(word_count: int, words_per_minute: int = 200) -> int:
@@ -36,59 +42,94 @@ def extract_excerpt(content: str | None, max_length: int = 300) -> str | None:
     return text
 
 
-async def parse_article(url: str) -> ParsedArticle:
+def default_site_name(url: str) -> str:
+    return urlparse(url).netloc.replace("www.", "")
+
+
+def empty_article(url: str) -> ParsedArticle:
+    """Placeholder data for an article whose content has not been fetched."""
+    return ParsedArticle(
+        title=url,
+        author=None,
+        content=None,
+        excerpt=None,
+        thumbnail_url=None,
+        site_name=default_site_name(url),
+        word_count=0,
+        reading_time_minutes=0,
+    )
+
+
+async def fetch_article(
+    url: str, etag: str | None = None, last_modified: str | None = None
+) -> ParsedArticle | None:
     """
     Fetch and parse article content from a URL.
-    Returns parsed article data or fallback values if parsing fails.
+    Raises if the page cannot be fetched, so callers can retry.
+
+    Given the validators of an earlier fetch, the request is conditional and
+    None is returned when the server answers 304 Not Modified.
     """
-    parsed_url = urlparse(url)
-    site_name = parsed_url.netloc.replace("www.", "")
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
 
-    try:
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            response = await client.get(url, headers={
-                "User-Agent": "Mozilla/5.0 (compatible; PocketApp/1.0)"
-            })
-            response.raise_for_status()
-            html = response.text
-    except Exception:
-        # If fetch fails, return minimal data
-        return ParsedArticle(
-            title=url,
-            author=None,
-            content=None,
-            excerpt=None,
-            thumbnail_url=None,
-            site_name=site_name,
-            word_count=0,
-            reading_time_minutes=0,
-        )
-
-    # Extract content using trafilatura
-    extracted = trafilatura.extract(
-        html,
+    async with host_slot(urlparse(url).netloc):
+        response = await get_http_client().get(url, headers=headers)
+        if response.status_code == 304 and headers:
+            return None
+        response.raise_for_status()
+        html = response.text
+
+    # Extraction is CPU-bound; keep it off the event loop
+    parsed = await run_in_pool(extract_article, url, html)
+    parsed.etag = response.headers.get("etag")
+    parsed.last_modified = response.headers.get("last-modified")
+    return parsed
+
+
+def extract_article(url: str, html: str) -> ParsedArticle:
+    """
+    Extract content and metadata from a page in a single pass.
+
+    The HTML is parsed into a tree once; trafilatura reads the metadata from
+    that tree before extracting the main text from a cleaned copy of it.
+    """
+    tree = load_html(html)
+    if tree is None:
+        return empty_article(url)
+
+    document = bare_extraction(
+        tree,
+        with_metadata=True,
         include_comments=False,
         include_tables=True,
         include_images=False,
-        output_format="txt",
+        as_dict=False,
     )
 
-    # Extract metadata
-    metadata = trafilatura.extract_metadata(html)
+    if document is not None:
+        content = normalize_unicode(document.text) or None
+    else:
+        # Too little text to extract, but the metadata may still be usable
+        document = extract_metadata(tree)
+        content = None
 
     title = url
     author = None
     thumbnail_url = None
+    site_name = default_site_name(url)
 
-    if metadata:
-        title = metadata.title or url
-        author = metadata.author
-        if metadata.image:
-            thumbnail_url = metadata.image
-        if metadata.sitename:
-            site_name = metadata.sitename
+    if document:
+        title = document.title or url
+        author = document.author
+        if document.image:
+            thumbnail_url = document.image
+        if document.sitename:
+            site_name = document.sitename
 
-    content = extracted or None
     word_count = len(content.split()) if content else 0
     reading_time = calculate_reading_time(word_count)
     excerpt = extract_excerpt(content)
@@ -103,3 +144,15 @@ async def parse_article(url: str) -> ParsedArticle:
         word_count=word_count,
         reading_time_minutes=reading_time,
     )
+
+
+async def parse_article(url: str) -> ParsedArticle:
+    """
+    Fetch and parse article content from a URL.
+    Returns parsed article data or fallback values if parsing fails.
+    """
+    try:
+        return await fetch_article(url)
+    except Exception:
+        # If fetch fails, return minimal data
+        return empty_article(url)
@@ -0,0 +1,185 @@
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from sqlalchemy import select, func, text, literal_column, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.models.article import Article
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+SNIPPET_TOKENS = 24
+MIN_PREFIX_LENGTH = 3
+
+_TERM_RE = re.compile(r"\w+")
+
+@dataclass
+class SearchPage:
+    limit: int
+    offset: int = 0
+    # (score, id) of the last hit on the previous page
+    after: tuple[float, int] | None = None
+    include_total: bool = False
+
+
+@dataclass
+class SearchHit:
+    article: Article
+    snippet: str | None
+    score: float
+
+
+def fts5_query(q: str) -> str | None:
+    """
+    Turn free text into a safe FTS5 query: every word must match, and the
+    last word also matches as a prefix so results update while typing.
+    Very short prefixes expand to too many terms to be worth it.
+    """
+    terms = _TERM_RE.findall(q)
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    if len(terms[-1]) >= MIN_PREFIX_LENGTH:
+        quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+async def _search_sqlite(db: AsyncSession, user_id: int, q: str, page: SearchPage, options: Sequence[LoaderOption]):
+    match_query = fts5_query(q)
+    if match_query is None:
+        return [], 0 if page.include_total else None
+
+    # CROSS JOIN pins the join order: let FTS5 find the matches, then check
+    # ownership by primary key. Otherwise SQLite may walk the user's articles
+    # and run a separate MATCH for each one.
+    params = {"query": match_query, "user_id": user_id}
+    total = None
+    if page.include_total:
+        total = (await db.execute(text("""
+            SELECT count(*)
+            FROM articles_fts CROSS JOIN articles ON articles.id = articles_fts.rowid
+            WHERE articles_fts MATCH :query AND articles.user_id = :user_id
+        """), params)).scalar_one()
+
+    # FTS5 emits rows best-first when ordered by its own `rank` column (ties
+    # in rowid order), so snippet() only runs for rows that make the page.
+    # bm25() is lower-is-better; title matches weigh 10x content matches.
+    after_clause = ""
+    if page.after is not None:
+        after_clause = """
+          AND (articles_fts.rank > :after_rank
+               OR (articles_fts.rank = :after_rank AND articles_fts.rowid > :after_id))
+        """
+        params.update(after_rank=-page.after[0], after_id=page.after[1])
+
+    ranked = (await db.execute(text(f"""
+        SELECT articles.id, articles_fts.rank,
+               snippet(articles_fts, -1, :start, :end, '…', :tokens)
+        FROM articles_fts CROSS JOIN articles ON articles.id = articles_fts.rowid
+        WHERE articles_fts MATCH :query
+          AND articles_fts.rank MATCH 'bm25(10.0, 1.0)'
+          AND articles.user_id = :user_id {after_clause}
+        ORDER BY articles_fts.rank
+        LIMIT :limit OFFSET :offset
+    """), {
+        **params,
+        "start": HIGHLIGHT_START,
+        "end": HIGHLIGHT_END,
+        "tokens": SNIPPET_TOKENS,
+        "limit": page.limit,
+        "offset": page.offset,
+    })).all()
+    if not ranked:
+        return [], total
+
+    article_ids = [article_id for article_id, _, _ in ranked]
+    loaded = await db.scalars(select(Article).options(*options).where(Article.id.in_(article_ids)))
+    articles = {article.id: article for article in loaded}
+
+    hits = [
+        SearchHit(article=articles[article_id], snippet=snippet, score=-bm25)
+        for article_id, bm25, snippet in ranked
+        if article_id in articles
+    ]
+    return hits, total
+
+
+async def _search_postgres(db: AsyncSession, user_id: int, q: str, page: SearchPage, options: Sequence[LoaderOption]):
+    document = literal_column("articles.search_vector")
+    query = func.websearch_to_tsquery(literal_column("'english'"), q)
+    score = func.ts_rank_cd(document, query)
+    base = select(Article.id).where(Article.user_id == user_id, document.op("@@")(query))
+
+    total = None
+    if page.include_total:
+        total = await db.scalar(select(func.count()).select_from(base.subquery()))
+
+    ranked_query = base.add_columns(score).order_by(score.desc(), Article.id)
+    if page.after is not None:
+        after_score, after_id = page.after
+        ranked_query = ranked_query.where(
+            or_(score < after_score, and_(score == after_score, Article.id > after_id))
+        )
+    ranked = (await db.execute(ranked_query.limit(page.limit).offset(page.offset))).all()
+    if not ranked:
+        return [], total
+
+    loaded = await db.scalars(
+        select(Article)
+        .options(*options, selectinload(Article.body))
+        .where(Article.id.in_([article_id for article_id, _ in ranked]))
+    )
+    articles = {article.id: article for article in loaded}
+    ranked = [(article_id, rank) for article_id, rank in ranked if article_id in articles]
+
+    # Bodies are compressed, so headlines are built from the decompressed text
+    headlines = (await db.scalars(text("""
+        SELECT ts_headline('english', document, websearch_to_tsquery('english', :query), :options)
+        FROM unnest(CAST(:documents AS text[])) WITH ORDINALITY AS page(document, position)
+        ORDER BY position
+    """), {
+        "query": q,
+        "options": f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, MaxWords=35, MinWords=15",
+        "documents": [articles[article_id].content or articles[article_id].title for article_id, _ in ranked],
+    })).all()
+
+    hits = [
+        SearchHit(article=articles[article_id], snippet=headline, score=rank)
+        for (article_id, rank), headline in zip(ranked, headlines)
+    ]
+    return hits, total
+
+
+async def _search_like(db: AsyncSession, user_id: int, q: str, page: SearchPage, options: Sequence[LoaderOption]):
+    """Unindexed fallback for databases without a full-text index. Bodies are
+    compressed, so only titles and excerpts are matched."""
+    query = select(Article).options(*options).where(
+        Article.user_id == user_id,
+        or_(Article.title.ilike(f"%{q}%"), Article.excerpt.ilike(f"%{q}%")),
+    )
+    total = None
+    if page.include_total:
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    if page.after is not None:
+        query = query.where(Article.id > page.after[1])
+    articles = (await db.scalars(query.order_by(Article.id).offset(page.offset).limit(page.limit))).all()
+    return [SearchHit(article=article, snippet=article.excerpt, score=0.0) for article in articles], total
+
+
+async def full_text_search(
+    db: AsyncSession, user_id: int, q: str, page: SearchPage, options: Sequence[LoaderOption] = ()
+) -> tuple[list[SearchHit], int | None]:
+    """
+    Relevance-ranked full-text search over a user's articles. Hits are
+    ordered by descending score, then ascending id. `options` are applied
+    when loading the hit articles, e.g. to defer columns the caller won't use.
+    """
+    dialect = db.bind.dialect.name
+    if dialect == "sqlite":
+        return await _search_sqlite(db, user_id, q, page, options)
+    if dialect == "postgresql":
+        return await _search_postgres(db, user_id, q, page, options)
+    return await _search_like(db, user_id, q, page, options)
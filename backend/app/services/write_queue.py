@@ -0,0 +1,148 @@
+"""
+Group commits for small writes.
+
+SQLite lets one connection write at a time, and every commit pays for a
+sync of the WAL. Under many concurrent one-row updates, requests spend
+most of their time waiting for the write lock. With `write_queue_enabled`,
+routes hand such statements to a single writer task instead. While one
+group is committing, the next queues up, so the writer commits everything
+waiting (up to `write_queue_max_batch` statements) in one transaction.
+
+Statements must stand alone: each is executed once, in submission order,
+and a failing statement is reported to its caller only. SQLite undoes just
+the failed statement, so the rest of the group still commits. Other
+databases abort the whole transaction on an error, so the queue is only
+used with SQLite.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Executable
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteQueueStats:
+    statements: int = 0
+    commits: int = 0
+
+
+@dataclass
+class _Write:
+    statement: Executable
+    done: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+class WriteQueue:
+    def __init__(self, engine: AsyncEngine, max_batch: int = 256, max_delay: float = 0.0):
+        self.engine = engine
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.stats = WriteQueueStats()
+        self._pending: asyncio.Queue[_Write | None] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Commit everything already submitted, then stop the writer."""
+        if self._task is not None:
+            await self._pending.put(None)
+            await self._task
+            self._task = None
+
+    async def execute(self, statement: Executable) -> Any:
+        """
+        Run `statement` in the next group commit. Returns its rows if it
+        returns any (e.g. with RETURNING), otherwise the affected row count.
+        """
+        if self._task is None:
+            raise RuntimeError("Write queue is not running")
+        write = _Write(statement)
+        await self._pending.put(write)
+        return await write.done
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = await self._pending.get()
+            if first is None:
+                break
+            batch = [first]
+            if self.max_delay:
+                await asyncio.sleep(self.max_delay)
+            while len(batch) < self.max_batch and not self._pending.empty():
+                write = self._pending.get_nowait()
+                if write is None:
+                    stopping = True
+                    break
+                batch.append(write)
+            try:
+                await self._commit(batch)
+            except Exception:
+                logger.exception("Group commit of %d writes failed", len(batch))
+
+    async def _commit(self, batch: list[_Write]) -> None:
+        outcomes: list[tuple[_Write, Any, BaseException | None]] = []
+        try:
+            async with self.engine.connect() as conn:
+                for write in batch:
+                    try:
+                        result = await conn.execute(write.statement)
+                        outcome = result.all() if result.returns_rows else result.rowcount
+                        outcomes.append((write, outcome, None))
+                    except Exception as exc:
+                        outcomes.append((write, None, exc))
+                await conn.commit()
+        except Exception as exc:
+            for write in batch:
+                if not write.done.done():
+                    write.done.set_exception(exc)
+            raise
+
+        self.stats.statements += len(batch)
+        self.stats.commits += 1
+        # Callers only hear back once their write is durable
+        for write, outcome, error in outcomes:
+            if write.done.done():
+                continue  # the request went away
+            if error is not None:
+                write.done.set_exception(error)
+            else:
+                write.done.set_result(outcome)
+
+
+_queue: WriteQueue | None = None
+
+
+def start_write_queue(engine: AsyncEngine) -> WriteQueue:
+    global _queue
+    if _queue is None:
+        _queue = WriteQueue(
+            engine,
+            max_batch=settings.write_queue_max_batch,
+            max_delay=settings.write_queue_max_delay_ms / 1000,
+        )
+        _queue.start()
+    return _queue
+
+
+async def stop_write_queue() -> None:
+    global _queue
+    if _queue is not None:
+        await _queue.stop()
+        _queue = None
+
+
+def get_write_queue() -> WriteQueue | None:
+    """The running queue, or None when writes should go straight to the database."""
+    return _queue
@@ -0,0 +1,152 @@
+"""
+Background ingestion worker.
+
+Claims pending parse jobs from the database, fetches and parses the article
+pages concurrently, and writes the results back. Run it alongside the API:
+
+    python -m app.worker --concurrency 8
+
+Any number of workers may run against the same database; jobs are handed out
+with expiring leases, so a crashed worker's jobs are picked up again.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+from contextlib import suppress
+
+from sqlalchemy.orm import sessionmaker
+
+from app.config import get_settings
+from app.database import SessionLocal, engine, Base
+from app.services import parse_cache
+from app.services.ingest import ClaimedJob, claim_jobs, complete_job, fail_job
+from app.services.extraction import start_extraction_pool, shutdown_extraction_pool
+from app.services.http_client import start_http_client, close_http_client
+from app.services.parser import ParsedArticle, fetch_article
+
+settings = get_settings()
+
+logger = logging.getLogger("app.worker")
+
+# Seconds between parse cache counter reports
+STATS_INTERVAL = 60.0
+
+
+async def fetch_parsed(url: str, session_factory: sessionmaker = SessionLocal) -> ParsedArticle:
+    """Parse a page, reusing the shared parse cache where it is still valid."""
+    with session_factory() as db:
+        cached = parse_cache.lookup(db, url)
+    if cached is not None and cached.fresh:
+        return cached.parsed
+
+    if cached is not None and (cached.parsed.etag or cached.parsed.last_modified):
+        parsed = await fetch_article(url, etag=cached.parsed.etag, last_modified=cached.parsed.last_modified)
+        if parsed is None:
+            with session_factory() as db:
+                parse_cache.mark_revalidated(db, url)
+            return cached.parsed
+    else:
+        parsed = await fetch_article(url)
+
+    with session_factory() as db:
+        parse_cache.store(db, url, parsed)
+    return parsed
+
+
+async def run_job(claimed: ClaimedJob, session_factory: sessionmaker = SessionLocal) -> None:
+    try:
+        parsed = await fetch_parsed(claimed.url, session_factory)
+    except Exception as exc:
+        logger.warning("Parse failed for %s (attempt %d): %s", claimed.url, claimed.attempts, exc)
+        with session_factory() as db:
+            fail_job(db, claimed, f"{type(exc).__name__}: {exc}")
+        return
+
+    with session_factory() as db:
+        if not complete_job(db, claimed, parsed):
+            logger.info("Discarded result for job %d: lease lost", claimed.job_id)
+
+
+async def process_batch(session_factory: sessionmaker = SessionLocal, limit: int | None = None) -> int:
+    """Claim one batch of runnable jobs and process it to completion."""
+    with session_factory() as db:
+        claimed = claim_jobs(db, limit or settings.worker_concurrency)
+    await asyncio.gather(*(run_job(job, session_factory) for job in claimed))
+    return len(claimed)
+
+
+def _report_cache_stats() -> None:
+    stats = parse_cache.stats
+    logger.info(
+        "Parse cache: %d hits, %d revalidated, %d misses, %d evictions (hit ratio %.0f%%)",
+        stats.hits, stats.revalidated, stats.misses, stats.evictions, 100 * stats.hit_ratio,
+    )
+
+
+async def run(
+    stop: asyncio.Event,
+    concurrency: int = settings.worker_concurrency,
+    poll_interval: float = settings.worker_poll_interval_seconds,
+    session_factory: sessionmaker = SessionLocal,
+) -> None:
+    in_flight: set[asyncio.Task] = set()
+    loop = asyncio.get_running_loop()
+    next_report = loop.time() + STATS_INTERVAL
+
+    while not stop.is_set():
+        if loop.time() >= next_report:
+            _report_cache_stats()
+            next_report = loop.time() + STATS_INTERVAL
+
+        claimed = []
+        free = concurrency - len(in_flight)
+        if free > 0:
+            with session_factory() as db:
+                claimed = claim_jobs(db, free)
+
+        for job in claimed:
+            task = asyncio.create_task(run_job(job, session_factory))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        if len(in_flight) >= concurrency:
+            await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        elif not claimed:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(stop.wait(), timeout=poll_interval)
+
+    if in_flight:
+        logger.info("Waiting for %d in-flight jobs", len(in_flight))
+        await asyncio.wait(in_flight)
+    _report_cache_stats()
+
+
+async def main(concurrency: int) -> None:
+    os.makedirs("data", exist_ok=True)
+    Base.metadata.create_all(bind=engine)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    start_http_client()
+    start_extraction_pool()
+    logger.info("Worker started with concurrency %d", concurrency)
+    try:
+        await run(stop, concurrency=concurrency)
+    finally:
+        await close_http_client()
+        shutdown_extraction_pool()
+    logger.info("Worker stopped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Process pending article parse jobs")
+    parser.add_argument("--concurrency", type=int, default=settings.worker_concurrency)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    asyncio.run(main(args.concurrency))
@@ -0,0 +1,168 @@
+"""
+Login storm benchmark: login throughput against list latency.
+
+Runs the API in-process against a temporary SQLite database. A burst of
+concurrent logins is fired while a probe keeps listing articles, and the
+probe's latency is compared with an idle baseline. `--mode inline` hashes
+inside a sync handler on the shared threadpool, as signup/login used to;
+`--mode pool` uses the dedicated, bounded hashing executor. Run from backend/:
+
+    python -m benchmarks.bench_login --mode pool
+    python -m benchmarks.bench_login --mode inline
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.database import Base, async_database_url, get_db
+from app.models.article import Article
+from app.models.user import User
+from app.routes import auth, articles
+from app.schemas.user import Token, UserLogin
+from app.services.auth import create_access_token, hash_password, shutdown_password_hasher, verify_password
+from app.services.token_cache import token_cache
+
+EMAIL = "bench@example.com"
+PASSWORD = "benchmark-password"
+
+
+def build_app(database_path: Path) -> FastAPI:
+    # Enough connections that the threadpool, not the connection pool, is the
+    # bottleneck; the inline handler holds a connection while it hashes
+    engine = create_engine(
+        f"sqlite:///{database_path}",
+        connect_args={"check_same_thread": False},
+        pool_size=64,
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine)
+
+    with factory() as db:
+        user = User(email=EMAIL, password_hash=hash_password(PASSWORD))
+        db.add(user)
+        db.commit()
+        db.execute(insert(Article), [
+            {"user_id": user.id, "url": f"https://example.com/{n}", "title": f"Article {n}"}
+            for n in range(500)
+        ])
+        db.commit()
+
+    async_engine = create_async_engine(
+        async_database_url(f"sqlite:///{database_path}"), poolclass=AsyncAdaptedQueuePool, pool_size=64
+    )
+    async_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with async_factory() as db:
+            yield db
+
+    def get_sync_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+
+    # The handler as it was before hashing moved to its own executor
+    @app.post("/api/auth/login-inline", response_model=Token)
+    def login_inline(user_data: UserLogin, db: Session = Depends(get_sync_db)):
+        user = db.query(User).filter(User.email == user_data.email).first()
+        if not user or not verify_password(user_data.password, user.password_hash):
+            raise HTTPException(status_code=401, detail="Invalid email or password")
+        return Token(access_token=create_access_token(user.id))
+
+    app.include_router(auth.router, prefix="/api/auth")
+    app.include_router(articles.router, prefix="/api/articles")
+    app.dependency_overrides[get_db] = override_get_db
+    app.state.async_engine = async_engine
+    return app
+
+
+async def probe_list(client: httpx.AsyncClient, headers: dict, stop: asyncio.Event) -> list[float]:
+    latencies = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get("/api/articles?limit=20", headers=headers)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def login_storm(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> dict[int, int]:
+    statuses: dict[int, int] = {}
+    remaining = iter(range(total))
+
+    async def login_loop():
+        for _ in remaining:
+            response = await client.post(path, json={"email": EMAIL, "password": PASSWORD})
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 503:
+                # Back off as a well-behaved client would
+                await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+
+    await asyncio.gather(*(login_loop() for _ in range(concurrency)))
+    return statuses
+
+
+def summarize(latencies: list[float]) -> str:
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1] if len(ordered) >= 20 else ordered[-1]
+    return f"p50 {statistics.median(ordered) * 1000:7.1f} ms  p95 {p95 * 1000:7.1f} ms  (n={len(ordered)})"
+
+
+async def run(mode: str, logins: int, concurrency: int, probes: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        app = build_app(Path(tmp) / "bench.db")
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            headers = {"Authorization": f"Bearer {create_access_token(1)}"}
+            token_cache.clear()
+
+            stop = asyncio.Event()
+            idle = asyncio.create_task(probe_list(client, headers, stop))
+            await asyncio.sleep(2)
+            stop.set()
+            baseline = await idle
+
+            stop = asyncio.Event()
+            probe_tasks = [asyncio.create_task(probe_list(client, headers, stop)) for _ in range(probes)]
+            path = "/api/auth/login" if mode == "pool" else "/api/auth/login-inline"
+            start = time.perf_counter()
+            statuses = await login_storm(client, path, logins, concurrency)
+            elapsed = time.perf_counter() - start
+            stop.set()
+            loaded = [latency for task in probe_tasks for latency in await task]
+        await app.state.async_engine.dispose()
+
+    shutdown_password_hasher()
+    succeeded = statuses.get(200, 0)
+    print(f"mode={mode}  logins={logins}  login concurrency={concurrency}")
+    print(f"  logins:             {succeeded / elapsed:7.1f}/s succeeded, statuses {dict(sorted(statuses.items()))}")
+    print(f"  list latency idle:  {summarize(baseline)}")
+    print(f"  list during storm:  {summarize(loaded)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mode", choices=["pool", "inline"], default="pool")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=64, help="concurrent login clients")
+    parser.add_argument("--probes", type=int, default=2, help="concurrent list clients")
+    args = parser.parse_args()
+    asyncio.run(run(args.mode, args.logins, args.concurrency, args.probes))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,48 @@
+import asyncio
+import os
+import tempfile
+
+# Cheap password hashes keep the suite fast; set before settings are loaded
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
-from app.database import Base, get_db
+from app.database import Base, apply_sqlite_profile, async_database_url, get_db
 from app.routes import auth, articles
 from app.services.auth import create_access_token
+from app.services.token_cache import token_cache
+from app import worker
 
-# Use in-memory SQLite for tests
-SQLALCHEMY_DATABASE_URL = "sqlite://"
+# A throwaway SQLite file: routes reach it through aiosqlite, while fixtures
+# and the worker use the sync engine
+_database_dir = tempfile.TemporaryDirectory()
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{_database_dir.name}/test.db"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# TestClient may run each request on a fresh event loop, so async
+# connections are not pooled across requests
+async_engine = create_async_engine(async_database_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
-def override_get_db():
-    db = TestingSessionLocal()
-    try:
+apply_sqlite_profile(engine)
+apply_sqlite_profile(async_engine.sync_engine)
+
+
+async def override_get_db():
+    async with TestingAsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # Create a test app without lifespan to avoid database issues
@@ -54,9 +70,9 @@ def db():
 
 @pytest.fixture(scope="function")
 def client(db):
-    Base.metadata.create_all(bind=engine)
+    # Tables are recreated per test by `db`, so user ids and tokens repeat
+    token_cache.clear()
     yield TestClient(test_app)
-    Base.metadata.drop_all(bind=engine)
 
 
 @pytest.fixture
@@ -78,3 +94,11 @@ def test_user(db):
 def auth_headers(test_user):
     token = create_access_token(test_user.id)
     return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def run_worker(db):
+    """Process every runnable parse job once, as `python -m app.worker` would."""
+    def _run() -> int:
+        return asyncio.run(worker.process_batch(TestingSessionLocal, limit=100))
+    return _run
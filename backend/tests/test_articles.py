@@ -17,8 +17,8 @@ def mock_parsed_article():
     )
 
 
-def test_create_article(client, auth_headers, mock_parsed_article):
-    with patch("app.routes.articles.parse_article", new_callable=AsyncMock) as mock_parser:
+def test_create_article(client, auth_headers, run_worker, mock_parsed_article):
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_parser:
         mock_parser.return_value = mock_parsed_article
 
         response = client.post(
@@ -27,16 +27,76 @@ def test_create_article(client, auth_headers, mock_parsed_article):
             headers=auth_headers,
         )
 
-        assert response.status_code == 201
+        # Saved immediately as a placeholder, parsed later by the worker
+        assert response.status_code == 202
         data = response.json()
-        assert data["title"] == "Test Article Title"
+        assert data["title"] == "https://example.com/article"
         assert data["url"] == "https://example.com/article"
         assert data["is_read"] is False
         assert data["is_archived"] is False
+        assert data["job"] == {"status": "pending", "attempts": 0, "last_error": None}
+
+        assert run_worker() == 1
+
+    response = client.get(f"/api/articles/{data['id']}", headers=auth_headers)
+    data = response.json()
+    assert data["title"] == "Test Article Title"
+    assert data["content"] == "This is the test article content."
+    assert data["job"] == {"status": "done", "attempts": 1, "last_error": None}
+
+
+def test_create_article_parse_failure_retries(client, auth_headers, run_worker, monkeypatch):
+    from app.services import ingest
+
+    monkeypatch.setattr(ingest.settings, "parse_job_retry_backoff_seconds", 0)
+    monkeypatch.setattr(ingest.settings, "parse_job_max_attempts", 2)
+
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_parser:
+        mock_parser.side_effect = RuntimeError("connection reset")
+
+        response = client.post(
+            "/api/articles",
+            json={"url": "https://example.com/article"},
+            headers=auth_headers,
+        )
+        article_id = response.json()["id"]
+
+        assert run_worker() == 1
+        job = client.get(f"/api/articles/{article_id}", headers=auth_headers).json()["job"]
+        assert job["status"] == "pending"
+        assert job["attempts"] == 1
+        assert "connection reset" in job["last_error"]
+
+        assert run_worker() == 1
+        job = client.get(f"/api/articles/{article_id}", headers=auth_headers).json()["job"]
+        assert job["status"] == "failed"
+        assert job["attempts"] == 2
+
+        # Failed jobs are not picked up again
+        assert run_worker() == 0
+
+
+def test_claim_jobs_leases_each_job_once(client, db, auth_headers):
+    from app.services.ingest import claim_jobs
+
+    for i in range(3):
+        client.post(
+            "/api/articles",
+            json={"url": f"https://example.com/article{i}"},
+            headers=auth_headers,
+        )
+
+    first = claim_jobs(db, limit=2)
+    second = claim_jobs(db, limit=2)
+
+    assert len(first) == 2
+    assert len(second) == 1
+    assert {job.job_id for job in first}.isdisjoint(job.job_id for job in second)
+    assert claim_jobs(db, limit=2) == []
 
 
 def test_create_article_duplicate(client, auth_headers, mock_parsed_article):
-    with patch("app.routes.articles.parse_article", new_callable=AsyncMock) as mock_parser:
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_parser:
         mock_parser.return_value = mock_parsed_article
 
         # Create first article
@@ -58,7 +118,7 @@ def test_create_article_duplicate(client, auth_headers, mock_parsed_article):
 
 
 def test_list_articles(client, auth_headers, mock_parsed_article):
-    with patch("app.routes.articles.parse_article", new_callable=AsyncMock) as mock_parser:
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_parser:
         mock_parser.return_value = mock_parsed_article
 
         # Create some articles
@@ -73,7 +133,7 @@ def test_list_articles(client, auth_headers, mock_parsed_article):
             headers=auth_headers,
         )
 
-    response = client.get("/api/articles", headers=auth_headers)
+    response = client.get("/api/articles?include_total=true", headers=auth_headers)
     assert response.status_code == 200
     data = response.json()
     assert data["total"] == 2
@@ -81,7 +141,7 @@ def test_list_articles(client, auth_headers, mock_parsed_article):
 
 
 def test_list_articles_filter_by_read(client, auth_headers, mock_parsed_article):
-    with patch("app.routes.articles.parse_article", new_callable=AsyncMock) as mock_parser:
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_parser:
         mock_parser.return_value = mock_parsed_article
 
         # Create article
@@ -100,18 +160,18 @@ def test_list_articles_filter_by_read(client, auth_headers, mock_parsed_article)
         )
 
     # Filter by is_read=True
-    response = client.get("/api/articles?is_read=true", headers=auth_headers)
+    response = client.get("/api/articles?is_read=true&include_total=true", headers=auth_headers)
     assert response.status_code == 200
     assert response.json()["total"] == 1
 
     # Filter by is_read=False
-    response = client.get("/api/articles?is_read=false", headers=auth_headers)
+    response = client.get("/api/articles?is_read=false&include_total=true", headers=auth_headers)
     assert response.status_code == 200
     assert response.json()["total"] == 0
 
 
 def test_get_article(client, auth_headers, mock_parsed_article):
-    with patch("app.routes.articles.parse_article", new_callable=AsyncMock) as mock_parser:
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_parser:
         mock_parser.return_value = mock_parsed_article
 
         # Create article
@@ -133,7 +193,7 @@ def test_get_article_not_found(client, auth_headers):
 
 
 def test_update_article(client, auth_headers, mock_parsed_article):
-    with patch("app.routes.articles.parse_article", new_callable=AsyncMock) as mock_parser:
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_parser:
         mock_parser.return_value = mock_parsed_article
 
         # Create article
@@ -157,7 +217,7 @@ def test_update_article(client, auth_headers, mock_parsed_article):
 
 
 def test_delete_article(client, auth_headers, mock_parsed_article):
-    with patch("app.routes.articles.parse_article", new_callable=AsyncMock) as mock_parser:
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_parser:
         mock_parser.return_value = mock_parsed_article
 
         # Create article
@@ -177,8 +237,8 @@ def test_delete_article(client, auth_headers, mock_parsed_article):
     assert response.status_code == 404
 
 
-def test_search_articles(client, auth_headers, mock_parsed_article):
-    with patch("app.routes.articles.parse_article", new_callable=AsyncMock) as mock_parser:
+def test_search_articles(client, auth_headers, run_worker, mock_parsed_article):
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_parser:
         mock_parser.return_value = mock_parsed_article
 
         # Create article
@@ -187,14 +247,15 @@ def test_search_articles(client, auth_headers, mock_parsed_article):
             json={"url": "https://example.com/article"},
             headers=auth_headers,
         )
+        run_worker()
 
     # Search by title
-    response = client.get("/api/articles/search?q=Test", headers=auth_headers)
+    response = client.get("/api/articles/search?q=Test&include_total=true", headers=auth_headers)
     assert response.status_code == 200
     assert response.json()["total"] == 1
 
     # Search with no results
-    response = client.get("/api/articles/search?q=nonexistent", headers=auth_headers)
+    response = client.get("/api/articles/search?q=nonexistent&include_total=true", headers=auth_headers)
     assert response.status_code == 200
     assert response.json()["total"] == 0
 
@@ -202,3 +263,191 @@ def test_search_articles(client, auth_headers, mock_parsed_article):
 def test_articles_unauthenticated(client):
     response = client.get("/api/articles")
     assert response.status_code == 403
+
+
+def test_create_articles_batch(client, auth_headers, run_worker, mock_parsed_article):
+    client.post(
+        "/api/articles",
+        json={"url": "https://example.com/existing"},
+        headers=auth_headers,
+    )
+
+    response = client.post(
+        "/api/articles/batch",
+        json={"urls": [
+            "https://example.com/one",
+            "https://example.com/existing",
+            "not a url",
+            "https://example.com/two",
+            "https://example.com/one",
+        ]},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 202
+    data = response.json()
+    assert data["queued"] == 2
+    assert [r["status"] for r in data["results"]] == ["queued", "duplicate", "invalid", "queued", "duplicate"]
+    assert all(r["article_id"] for r in data["results"] if r["status"] == "queued")
+
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_parser:
+        mock_parser.return_value = mock_parsed_article
+        assert run_worker() == 3
+
+    response = client.get("/api/articles?include_total=true", headers=auth_headers)
+    assert response.json()["total"] == 3
+    assert {a["job"]["status"] for a in response.json()["articles"]} == {"done"}
+
+
+def test_search_articles_full_text(client, auth_headers, run_worker):
+    pages = {
+        "https://example.com/pools": ("Tuning connection pools", "Keep-alive reuse matters for latency."),
+        "https://example.com/gardening": ("Spring gardening", "Plant tomatoes after the last frost. Pools of water drown roots."),
+    }
+
+    async def fake_fetch(url):
+        title, content = pages[url]
+        return ParsedArticle(
+            title=title, author=None, content=content, excerpt=content, thumbnail_url=None,
+            site_name="example.com", word_count=len(content.split()), reading_time_minutes=1,
+        )
+
+    with patch("app.worker.fetch_article", new=fake_fetch):
+        for url in pages:
+            client.post("/api/articles", json={"url": url}, headers=auth_headers)
+        run_worker()
+
+    # Matches content, not just titles
+    response = client.get("/api/articles/search?q=tomatoes&include_total=true", headers=auth_headers)
+    data = response.json()
+    assert data["total"] == 1
+    assert data["articles"][0]["title"] == "Spring gardening"
+    assert "<mark>tomatoes</mark>" in data["articles"][0]["snippet"]
+
+    # Title matches rank above content matches; stemming and prefixes apply
+    response = client.get("/api/articles/search?q=pool", headers=auth_headers)
+    titles = [a["title"] for a in response.json()["articles"]]
+    assert titles == ["Tuning connection pools", "Spring gardening"]
+
+    # Deleting an article removes it from the index
+    article_id = response.json()["articles"][0]["id"]
+    client.delete(f"/api/articles/{article_id}", headers=auth_headers)
+    response = client.get("/api/articles/search?q=pool", headers=auth_headers)
+    assert [a["title"] for a in response.json()["articles"]] == ["Spring gardening"]
+
+    # Query syntax characters are treated as plain text
+    response = client.get('/api/articles/search?q="AND (&include_total=true', headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+
+
+def test_list_articles_cursor_pagination(client, db, auth_headers, test_user):
+    from datetime import datetime, timedelta
+    from app.models.article import Article
+
+    base = datetime(2026, 1, 1)
+    for i in range(5):
+        # Two articles share each timestamp, so ties are broken by id
+        db.add(Article(user_id=test_user.id, url=f"https://example.com/{i}", title=f"Article {i}",
+                       saved_at=base + timedelta(minutes=i // 2)))
+    db.commit()
+
+    seen = []
+    url = "/api/articles?limit=2"
+    while True:
+        data = client.get(url, headers=auth_headers).json()
+        assert data["total"] is None
+        seen.extend(a["title"] for a in data["articles"])
+        if data["next_cursor"] is None:
+            break
+        url = f"/api/articles?limit=2&cursor={data['next_cursor']}"
+
+    assert seen == ["Article 4", "Article 3", "Article 2", "Article 1", "Article 0"]
+
+    # Offset paging still works, and hands out a cursor to continue from
+    data = client.get("/api/articles?limit=2&offset=2&include_total=true", headers=auth_headers).json()
+    assert [a["title"] for a in data["articles"]] == ["Article 2", "Article 1"]
+    assert data["total"] == 5
+    data = client.get(f"/api/articles?limit=2&cursor={data['next_cursor']}", headers=auth_headers).json()
+    assert [a["title"] for a in data["articles"]] == ["Article 0"]
+
+    response = client.get("/api/articles?cursor=bogus", headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_search_articles_cursor_pagination(client, db, auth_headers, test_user):
+    from app.models.article import Article
+
+    for i in range(5):
+        # Identical documents score the same, so ties are broken by id
+        db.add(Article(user_id=test_user.id, url=f"https://example.com/{i}",
+                       title="Reading list", content="A note about sourdough baking."))
+    db.commit()
+
+    seen = []
+    url = "/api/articles/search?q=sourdough&limit=2"
+    while url:
+        data = client.get(url, headers=auth_headers).json()
+        seen.extend(a["id"] for a in data["articles"])
+        url = data["next_cursor"] and f"/api/articles/search?q=sourdough&limit=2&cursor={data['next_cursor']}"
+
+    assert seen == sorted(seen)
+    assert len(seen) == 5
+
+
+def test_list_articles_omits_content(client, db, auth_headers, test_user):
+    from sqlalchemy import event
+    from app.models.article import Article
+    from tests.conftest import engine
+
+    db.add(Article(user_id=test_user.id, url="https://example.com/long", title="Long read",
+                   content="word " * 10000, excerpt="word word"))
+    db.commit()
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        data = client.get("/api/articles", headers=auth_headers).json()
+        search = client.get("/api/articles/search?q=word", headers=auth_headers).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert "content" not in data["articles"][0]
+    assert data["articles"][0]["excerpt"] == "word word"
+    assert "content" not in search["articles"][0]
+    # The body is never read from the database for a listing
+    assert not any("articles.content" in statement for statement in statements)
+
+    article_id = data["articles"][0]["id"]
+    response = client.get(f"/api/articles/{article_id}", headers=auth_headers)
+    assert len(response.json()["content"]) == 50000
+
+
+def test_list_articles_fields_selector(client, db, auth_headers, test_user):
+    from app.models.article import Article
+
+    for i in range(3):
+        db.add(Article(user_id=test_user.id, url=f"https://example.com/{i}", title=f"Article {i}",
+                       content="A note about sourdough baking."))
+    db.commit()
+
+    data = client.get("/api/articles?fields=id,title&limit=2", headers=auth_headers).json()
+    assert [set(a) for a in data["articles"]] == [{"id", "title"}, {"id", "title"}]
+    assert data["next_cursor"]
+
+    data = client.get(
+        f"/api/articles?fields=title,job&limit=2&cursor={data['next_cursor']}", headers=auth_headers
+    ).json()
+    assert data["articles"] == [{"title": "Article 0", "job": None}]
+
+    data = client.get("/api/articles/search?q=sourdough&fields=id,score", headers=auth_headers).json()
+    assert len(data["articles"]) == 3
+    assert all(set(a) == {"id", "score"} for a in data["articles"])
+
+    response = client.get("/api/articles?fields=title,content", headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: content"
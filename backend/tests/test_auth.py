@@ -54,3 +54,77 @@ def test_get_me_authenticated(client, auth_headers):
 def test_get_me_unauthenticated(client):
     response = client.get("/api/auth/me")
     assert response.status_code == 403  # No token provided
+
+
+def test_authentication_is_cached(client, db, test_user, auth_headers):
+    from sqlalchemy import event
+    from tests.conftest import engine
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    assert client.get("/api/articles", headers=auth_headers).status_code == 200
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert client.get("/api/articles", headers=auth_headers).status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert not any("FROM users" in statement for statement in statements)
+
+    # Changing or deleting the user drops its cached tokens
+    test_user.email = "renamed@example.com"
+    db.commit()
+    assert client.get("/api/auth/me", headers=auth_headers).json()["email"] == "renamed@example.com"
+
+    db.delete(test_user)
+    db.commit()
+    response = client.get("/api/articles", headers=auth_headers)
+    assert response.status_code == 401
+
+
+def test_token_cache_bounds():
+    import time
+    from app.services.token_cache import Principal, TokenCache
+
+    cache = TokenCache(max_entries=2, ttl_seconds=60)
+    for i in range(3):
+        cache.put(f"token-{i}", Principal(user_id=i, email=f"{i}@example.com"))
+    assert len(cache) == 2
+    assert cache.get("token-0") is None
+    assert cache.get("token-2").user_id == 2
+
+    # Never cached beyond the token's own expiry
+    cache.put("expired", Principal(user_id=9, email="9@example.com"), token_expires_at=time.time() - 1)
+    assert cache.get("expired") is None
+
+    cache.invalidate_user(2)
+    assert cache.get("token-2") is None
+    assert cache.get("token-1").user_id == 1
+
+
+def test_bcrypt_rounds_from_settings(test_user):
+    # conftest sets BCRYPT_ROUNDS=4
+    assert test_user.password_hash.startswith("$2b$04$")
+
+
+def test_login_sheds_load_when_hasher_is_saturated(client, test_user, monkeypatch):
+    from app.services import auth
+
+    limit = auth.settings.password_hash_workers + auth.settings.password_hash_queue_size
+    monkeypatch.setattr(auth, "_hashes_pending", limit)
+
+    response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+    monkeypatch.setattr(auth, "_hashes_pending", limit - 1)
+    response = client.post(
+        "/api/auth/login",
+        json={"email": "test@example.com", "password": "testpassword"},
+    )
+    assert response.status_code == 200
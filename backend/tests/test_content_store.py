@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import text
+
+from app.models.article import Article
+from app.models.article_content import ArticleContent
+from app.services.compression import compress_text, decompress_text
+
+
+def assert_search_index_consistent(db):
+    # Fails with "database disk image is malformed" if the index has drifted
+    db.execute(text("INSERT INTO articles_fts(articles_fts, rank) VALUES ('integrity-check', 1)"))
+
+
+def test_compression_round_trip():
+    body = "The government said the report would be published next week. " * 50
+    codec, data = compress_text(body)
+    assert len(data) < len(body) / 4
+    assert decompress_text(codec, data) == body
+
+    with pytest.raises(ValueError):
+        decompress_text("lz4", data)
+
+
+def test_content_stored_compressed_out_of_row(db, test_user):
+    body = "A long note about sourdough baking and starter hydration. " * 200
+    article = Article(user_id=test_user.id, url="https://example.com/a", title="Bread", content=body)
+    db.add(article)
+    db.commit()
+
+    stored = db.get(ArticleContent, article.id)
+    assert stored.size == len(body.encode())
+    assert len(stored.data) < stored.size / 10
+    assert "content" not in {column.name for column in Article.__table__.columns}
+
+    db.expire_all()
+    assert db.get(Article, article.id).content == body
+
+
+def test_search_index_follows_content_changes(client, db, test_user, auth_headers):
+    article = Article(user_id=test_user.id, url="https://example.com/a", title="Bread", content="Sourdough starter")
+    db.add(article)
+    db.commit()
+    assert_search_index_consistent(db)
+
+    def search(q):
+        return [a["id"] for a in client.get(f"/api/articles/search?q={q}", headers=auth_headers).json()["articles"]]
+
+    assert search("sourdough") == [article.id]
+
+    article.title = "Rye"
+    article.content = "Pumpernickel crumb"
+    db.commit()
+    assert_search_index_consistent(db)
+    assert search("sourdough") == []
+    assert search("pumpernickel") == [article.id]
+
+    article.content = None
+    db.commit()
+    assert_search_index_consistent(db)
+    assert search("pumpernickel") == []
+    assert search("rye") == [article.id]
+
+    article.content = "Seeded loaf"
+    db.commit()
+    assert client.delete(f"/api/articles/{article.id}", headers=auth_headers).status_code == 204
+    assert_search_index_consistent(db)
+    assert search("seeded") == []
+    assert db.query(ArticleContent).count() == 0
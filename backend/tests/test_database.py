@@ -0,0 +1,26 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.database import async_database_url
+from app.models.article import Article
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def test_async_database_url():
+    assert async_database_url("sqlite:///./data/pocket.db") == "sqlite+aiosqlite:///./data/pocket.db"
+    assert async_database_url("postgresql://app:secret@db/pocket") == "postgresql+asyncpg://app:secret@db/pocket"
+    assert async_database_url("postgresql+psycopg2://db/pocket") == "postgresql+asyncpg://db/pocket"
+
+
+def test_async_connections_can_read_compressed_bodies(db, test_user):
+    article = Article(user_id=test_user.id, url="https://example.com/a", title="Bread", content="Sourdough starter")
+    db.add(article)
+    db.commit()
+
+    async def read_body():
+        async with TestingAsyncSessionLocal() as session:
+            return await session.scalar(text("SELECT content FROM article_texts WHERE id = :id"), {"id": article.id})
+
+    # article_text() must be registered on aiosqlite connections too
+    assert asyncio.run(read_body()) == "Sourdough starter"
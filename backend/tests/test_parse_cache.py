@@ -0,0 +1,104 @@
+import asyncio
+from unittest.mock import patch, AsyncMock
+
+import httpx
+import pytest
+
+from app.models.parsed_page import ParsedPage
+from app.services import http_client, parse_cache
+from app.services.extraction import shutdown_extraction_pool
+from app.services.parse_cache import canonical_url
+from app.services.parser import ParsedArticle
+from tests.test_parser import ARTICLE_HTML
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    fresh = parse_cache.ParseCacheStats()
+    monkeypatch.setattr(parse_cache, "stats", fresh)
+    return fresh
+
+
+def parsed_article(title: str = "Shared Article") -> ParsedArticle:
+    return ParsedArticle(
+        title=title, author=None, content="Cached body text.", excerpt="Cached body text.",
+        thumbnail_url=None, site_name="example.com", word_count=3, reading_time_minutes=1,
+    )
+
+
+def test_canonical_url():
+    assert canonical_url("HTTPS://Example.com:443/a?b=2&a=1#section") == "https://example.com/a?a=1&b=2"
+    assert canonical_url("https://example.com/a?utm_source=x&fbclid=y&id=3") == "https://example.com/a?id=3"
+    assert canonical_url("http://example.com") == "http://example.com/"
+    assert canonical_url("http://example.com:8080/a") == "http://example.com:8080/a"
+
+
+@pytest.fixture
+def other_headers(db):
+    from app.models.user import User
+    from app.services.auth import create_access_token
+
+    other = User(email="other@example.com", password_hash="x")
+    db.add(other)
+    db.commit()
+    return {"Authorization": f"Bearer {create_access_token(other.id)}"}
+
+
+def test_popular_url_is_parsed_once(client, db, auth_headers, other_headers, run_worker, stats):
+    with patch("app.worker.fetch_article", new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = parsed_article()
+
+        client.post("/api/articles", json={"url": "https://example.com/story"}, headers=auth_headers)
+        run_worker()
+        client.post(
+            "/api/articles", json={"url": "https://Example.com/story?utm_source=feed"}, headers=other_headers
+        )
+        run_worker()
+
+    assert mock_fetch.await_count == 1
+    assert (stats.hits, stats.misses) == (1, 1)
+
+    data = client.get("/api/articles", headers=other_headers).json()
+    assert data["articles"][0]["title"] == "Shared Article"
+    assert db.query(ParsedPage).one().hits == 1
+
+
+def test_stale_entry_is_revalidated(client, db, auth_headers, other_headers, run_worker, stats, monkeypatch):
+    from app.models.article import Article
+
+    monkeypatch.setattr(parse_cache.settings, "parse_cache_ttl_seconds", 0)
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, html=ARTICLE_HTML, headers={"ETag": '"v1"'})
+
+    http_client.start_http_client(httpx.MockTransport(handler))
+    try:
+        client.post("/api/articles", json={"url": "https://example.com/a"}, headers=auth_headers)
+        run_worker()
+        assert db.query(ParsedPage).one().etag == '"v1"'
+
+        client.post("/api/articles", json={"url": "https://example.com/a"}, headers=other_headers)
+        run_worker()
+    finally:
+        asyncio.run(http_client.close_http_client())
+        shutdown_extraction_pool()
+
+    assert [request.headers.get("if-none-match") for request in requests] == [None, '"v1"']
+    assert (stats.misses, stats.revalidated) == (1, 1)
+    assert {article.title for article in db.query(Article)} == {"Pooled Fetching"}
+
+
+def test_eviction_keeps_most_recently_used(db, stats, monkeypatch):
+    monkeypatch.setattr(parse_cache.settings, "parse_cache_max_entries", 3)
+
+    for i in range(5):
+        parse_cache.store(db, f"https://example.com/{i}", parsed_article(f"Article {i}"))
+    assert parse_cache.lookup(db, "https://example.com/0") is None
+    assert parse_cache.lookup(db, "https://example.com/4").parsed.title == "Article 4"
+
+    assert db.query(ParsedPage).count() == 3
+    assert stats.evictions == 2
@@ -0,0 +1,121 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import http_client
+from app.services.extraction import ExtractionTimeout, call_with_cpu_budget, shutdown_extraction_pool
+from app.services.parser import extract_article, fetch_article, parse_article
+
+ARTICLE_HTML = """
+<html>
+  <head>
+    <title>Pooled Fetching</title>
+    <meta name="author" content="Jane Doe">
+  </head>
+  <body>
+    <article>
+      <h1>Pooled Fetching</h1>
+      <p>Reusing connections avoids a fresh TCP and TLS handshake for every article
+      that is saved from the same publisher, which keeps fetch latency low.</p>
+      <p>Keep-alive connections are shared across every request made by the worker,
+      and each host gets a bounded number of concurrent connections.</p>
+    </article>
+  </body>
+</html>
+"""
+
+
+@pytest.fixture
+def mock_transport():
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, html=ARTICLE_HTML)
+
+    http_client.start_http_client(httpx.MockTransport(handler))
+    yield requests
+    asyncio.run(http_client.close_http_client())
+    shutdown_extraction_pool()
+
+
+def test_fetch_article_uses_shared_client(mock_transport):
+    async def fetch_two():
+        client = http_client.get_http_client()
+        first = await fetch_article("https://example.com/a")
+        second = await fetch_article("https://example.com/b")
+        assert http_client.get_http_client() is client
+        return first, second
+
+    first, second = asyncio.run(fetch_two())
+
+    assert first.title == "Pooled Fetching"
+    assert second.word_count > 0
+    assert [r.headers["User-Agent"] for r in mock_transport] == [http_client.USER_AGENT] * 2
+
+
+def test_fetch_article_limits_connections_per_host(mock_transport, monkeypatch):
+    monkeypatch.setattr(http_client.settings, "http_max_connections_per_host", 2)
+    active = {"now": 0, "peak": 0}
+    original_get = http_client.get_http_client().get
+
+    async def tracking_get(url, **kwargs):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        try:
+            return await original_get(url, **kwargs)
+        finally:
+            active["now"] -= 1
+
+    monkeypatch.setattr(http_client.get_http_client(), "get", tracking_get)
+
+    async def fetch_many():
+        await asyncio.gather(*(fetch_article(f"https://example.com/{i}") for i in range(6)))
+
+    asyncio.run(fetch_many())
+
+    assert len(mock_transport) == 6
+    assert active["peak"] == 2
+
+
+def test_parse_article_falls_back_on_http_error(mock_transport):
+    parsed = asyncio.run(parse_article("https://www.example.com/missing"))
+
+    assert parsed.title == "https://www.example.com/missing"
+    assert parsed.content is None
+    assert parsed.site_name == "example.com"
+
+
+def test_cpu_budget_stops_runaway_extraction():
+    def spin():
+        while True:
+            pass
+
+    with pytest.raises(ExtractionTimeout):
+        call_with_cpu_budget(spin, budget=0.05)
+
+    assert call_with_cpu_budget(sum, [1, 2, 3], budget=0.05) == 6
+
+
+def test_extract_article_single_pass():
+    parsed = extract_article("https://www.example.com/post", ARTICLE_HTML)
+
+    assert parsed.title == "Pooled Fetching"
+    assert parsed.author == "Jane Doe"
+    assert "Reusing connections avoids a fresh TCP and TLS handshake" in parsed.content
+    assert parsed.word_count == len(parsed.content.split())
+    assert parsed.site_name == "example.com"
+
+
+def test_extract_article_keeps_metadata_without_body():
+    html = "<html><head><title>Just a title</title></head><body></body></html>"
+
+    parsed = extract_article("https://example.com/empty", html)
+
+    assert parsed.title == "Just a title"
+    assert parsed.content is None
+    assert parsed.word_count == 0
@@ -0,0 +1,146 @@
+"""
+Query-plan regression tests: every article query a route issues must be
+answered from an index, and must never fall back to sorting in a temp B-tree.
+"""
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from app.models.article import Article
+from app.models.article_content import ArticleContent
+from app.models.user import User
+from app.services.compression import compress_text
+from tests.conftest import async_engine, engine
+
+LIBRARY_SIZE = 5000
+
+
+@pytest.fixture
+def large_library(db, test_user):
+    other = User(email="other@example.com", password_hash="x")
+    db.add(other)
+    db.commit()
+
+    start = datetime(2024, 1, 1)
+    codec, data = compress_text("A body about databases")
+    for owner in (test_user.id, other.id):
+        ids = db.scalars(insert(Article).returning(Article.id), [
+            {
+                "user_id": owner,
+                "url": f"https://example.com/{owner}/{n}",
+                "title": f"Article {n}",
+                "word_count": 5,
+                "reading_time_minutes": 1,
+                "is_read": n % 3 == 0,
+                "is_archived": n % 5 == 0,
+                "saved_at": start + timedelta(minutes=n),
+                "updated_at": start + timedelta(minutes=n),
+            }
+            for n in range(LIBRARY_SIZE)
+        ]).all()
+        db.execute(insert(ArticleContent), [
+            {"article_id": article_id, "codec": codec, "size": 22, "data": data} for article_id in ids
+        ])
+    db.commit()
+    db.execute(text("ANALYZE"))
+    db.commit()
+    return test_user
+
+
+@contextmanager
+def captured_queries():
+    """Record every SELECT run against the test engines."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    # Routes query through the async engine; its events fire on the sync core
+    engines = (engine, async_engine.sync_engine)
+    for target in engines:
+        event.listen(target, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        for target in engines:
+            event.remove(target, "before_cursor_execute", record)
+
+
+def query_plan(statement, parameters) -> list[str]:
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[-1] for row in rows]
+
+
+def assert_indexed(statements):
+    assert statements
+    for statement, parameters in statements:
+        if "article" not in statement:
+            continue
+        plan = query_plan(statement, parameters)
+        for step in plan:
+            assert "TEMP B-TREE" not in step, (statement, plan)
+            # Only the FTS virtual table and derived subqueries may be scanned
+            if step.startswith("SCAN") and "VIRTUAL TABLE" not in step:
+                assert not step.startswith(("SCAN article", "SCAN parse_jobs")), (statement, plan)
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"is_archived": "false"},
+    {"is_archived": "true"},
+    {"is_read": "false"},
+    {"is_archived": "false", "is_read": "true"},
+    {"include_total": "true"},
+    {"is_archived": "false", "include_total": "true"},
+])
+def test_list_queries_use_indexes(client, auth_headers, large_library, params):
+    with captured_queries() as statements:
+        response = client.get("/api/articles", params={**params, "limit": 20}, headers=auth_headers)
+        assert response.status_code == 200
+        cursor = response.json()["next_cursor"]
+        assert cursor
+
+        response = client.get(
+            "/api/articles", params={**params, "limit": 20, "cursor": cursor}, headers=auth_headers
+        )
+        assert response.status_code == 200
+
+    assert_indexed(statements)
+
+
+def test_search_query_uses_indexes(client, auth_headers, large_library):
+    with captured_queries() as statements:
+        response = client.get(
+            "/api/articles/search", params={"q": "databases", "include_total": "true"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["articles"]
+
+    assert_indexed(statements)
+
+
+def test_save_queries_use_indexes(client, auth_headers, large_library):
+    with captured_queries() as statements:
+        response = client.post(
+            "/api/articles", json={"url": "https://example.com/new"}, headers=auth_headers
+        )
+        assert response.status_code == 202
+        article_id = response.json()["id"]
+
+        response = client.post(
+            "/api/articles/batch",
+            json={"urls": ["https://example.com/batch", f"https://example.com/{large_library.id}/1"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 202
+
+        assert client.get(f"/api/articles/{article_id}", headers=auth_headers).status_code == 200
+        response = client.patch(f"/api/articles/{article_id}", json={"is_read": True}, headers=auth_headers)
+        assert response.status_code == 200
+        assert client.delete(f"/api/articles/{article_id}", headers=auth_headers).status_code == 204
+
+    assert_indexed(statements)
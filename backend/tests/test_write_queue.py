@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+from sqlalchemy import insert, select, text, update
+from sqlalchemy.exc import IntegrityError
+
+from app.models.article import Article
+from app.services.write_queue import WriteQueue, start_write_queue, stop_write_queue
+from tests.conftest import async_engine, engine
+
+
+def test_sqlite_profile_applied_to_both_engines():
+    async def async_pragmas():
+        async with async_engine.connect() as conn:
+            return [
+                (await conn.exec_driver_sql(f"PRAGMA {name}")).scalar()
+                for name in ("journal_mode", "synchronous", "busy_timeout")
+            ]
+
+    with engine.connect() as conn:
+        sync_pragmas = [
+            conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout")
+        ]
+
+    # synchronous=NORMAL reads back as 1
+    assert sync_pragmas == asyncio.run(async_pragmas()) == ["wal", 1, 5000]
+
+
+@pytest.fixture
+def articles(db, test_user):
+    return db.scalars(insert(Article).returning(Article.id), [
+        {"user_id": test_user.id, "url": f"https://example.com/{n}", "title": f"Article {n}"}
+        for n in range(50)
+    ]).all()
+
+
+def test_concurrent_writes_share_commits(db, articles):
+    async def mark_all_read():
+        queue = WriteQueue(async_engine)
+        queue.start()
+        try:
+            counts = await asyncio.gather(*(
+                queue.execute(update(Article).where(Article.id == article_id).values(is_read=True))
+                for article_id in articles
+            ))
+            # Rejected statements fail only their own caller
+            with pytest.raises(IntegrityError):
+                await queue.execute(insert(Article).values(id=articles[0], user_id=1, url="x", title="x"))
+        finally:
+            await queue.stop()
+        return counts, queue.stats
+
+    counts, stats = asyncio.run(mark_all_read())
+
+    assert counts == [1] * len(articles)
+    assert stats.statements == len(articles) + 1
+    assert stats.commits < len(articles) / 2
+    assert db.scalar(select(Article.id).where(Article.is_read.is_(False))) is None
+
+
+def test_patch_through_write_queue(client, auth_headers, articles):
+    with client:
+        client.portal.call(start_write_queue, async_engine)
+        try:
+            response = client.patch(
+                f"/api/articles/{articles[0]}", json={"is_archived": True}, headers=auth_headers
+            )
+            assert response.status_code == 200
+            assert response.json()["is_archived"] is True
+
+            response = client.patch("/api/articles/999999", json={"is_read": True}, headers=auth_headers)
+            assert response.status_code == 404
+        finally:
+            client.portal.call(stop_write_queue)
+
+    assert client.get(f"/api/articles/{articles[0]}", headers=auth_headers).json()["is_archived"] is True
@@ -1,8 +1,8 @@
 import { Archive, Trash2, Check, RotateCcw } from 'lucide-react';
-import type { Article } from '../types';
+import type { ArticleSummary } from '../types';
 
 interface ArticleCardProps {
-  article: Article;
+  article: ArticleSummary;
   onRead: () => void;
   onArchive: () => void;
   onDelete: () => void;
@@ -64,6 +64,7 @@ export const articlesApi = {
     if (filters?.is_read !== undefined) params.append('is_read', String(filters.is_read));
     if (filters?.is_archived !== undefined) params.append('is_archived', String(filters.is_archived));
     if (filters?.limit) params.append('limit', String(filters.limit));
+    if (filters?.cursor) params.append('cursor', filters.cursor);
     if (filters?.offset) params.append('offset', String(filters.offset));
 
     const { data } = await api.get<ArticleListResponse>(`/api/articles?${params}`);
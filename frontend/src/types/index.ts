@@ -4,6 +4,12 @@ export interface User {
   created_at: string;
 }
 
+export interface ParseJob {
+  status: 'pending' | 'parsing' | 'done' | 'failed';
+  attempts: number;
+  last_error: string | null;
+}
+
 export interface Article {
   id: number;
   url: string;
@@ -19,11 +25,16 @@ export interface Article {
   is_archived: boolean;
   saved_at: string;
   updated_at: string;
+  job: ParseJob | null;
 }
 
+/** Lists and search results omit the article body; fetch it by id. */
+export type ArticleSummary = Omit<Article, 'content'>;
+
 export interface ArticleListResponse {
-  articles: Article[];
-  total: number;
+  articles: ArticleSummary[];
+  total: number | null;
+  next_cursor: string | null;
 }
 
 export interface Token {
@@ -45,5 +56,7 @@ export interface ArticleFilters {
   is_read?: boolean;
   is_archived?: boolean;
   limit?: number;
+  cursor?: string;
+  /** @deprecated use cursor */
   offset?: number;
 }